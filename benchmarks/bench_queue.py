@@ -0,0 +1,56 @@
+# benchmarks/bench_queue.py
+
+import time
+import multiprocessing as mp
+from hyperprocess.core.queue import Queue
+
+N = 100_000
+CALLS = 20_000
+
+
+def producer(q, n):
+    for i in range(n):
+        q.put(i)
+
+
+def consumer(q, n):
+    for _ in range(n):
+        q.get()
+
+
+def stress(q, ctx):
+    """Producer and consumer processes passing N small ints."""
+    p1 = ctx.Process(target=producer, args=(q, N))
+    p2 = ctx.Process(target=consumer, args=(q, N))
+    start = time.perf_counter()
+    p1.start()
+    p2.start()
+    p1.join()
+    p2.join()
+    return time.perf_counter() - start
+
+
+def per_call(q):
+    """Mean put and get latency in one process, in microseconds."""
+    start = time.perf_counter()
+    for i in range(CALLS):
+        q.put(i)
+    put = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        q.get()
+    get = time.perf_counter() - start
+    return put / CALLS * 1e6, get / CALLS * 1e6
+
+
+if __name__ == "__main__":
+    ctx = mp.get_context("spawn")
+    queues = {
+        "Queue(maxsize=10**6)": lambda: Queue(maxsize=10**6, ctx=ctx),
+        "Queue()": lambda: Queue(ctx=ctx),
+        "multiprocessing.Queue()": ctx.Queue,
+    }
+    for name, make in queues.items():
+        elapsed = min(stress(make(), ctx) for _ in range(3))
+        put, get = per_call(make())
+        print(f"{name:<24} stress {elapsed:.3f}s  put {put:.2f}us  get {get:.2f}us")
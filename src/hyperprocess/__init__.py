@@ -12,22 +12,42 @@ __version__ = "0.1.0"
 __author__ = "Amir Hossein Partovi"
 __license__ = "Custom - Open Source Friendly"
 
-# Core modules
-from .core.cpu import compute
-from .core.io import streams
-from .core.shared import queues
-
-# Parallel pools
-from .pool.threadpool import ThreadPoolExecutorPlus
-from .pool.processpool import ProcessPoolExecutorPlus
-
-# Accelerated integrations
-from .integration.numpy_accel import NumpyAccelerator
-from .integration.pandas_accel import PandasAccelerator
-from .integration.sklearn_accel import SklearnAccelerator
-
-# Expose key utilities for direct access
-from .decorators import parallelize, profile_execution
+# Top-level exports are resolved on first access (PEP 562), so importing a
+# submodule such as ``hyperprocess.core.queue`` does not pull in (or fail
+# on) the optional integrations and every pool implementation.
+_LAZY = {
+    # Core modules
+    "compute": (".core.cpu", "compute"),
+    "streams": (".core.io", "streams"),
+    "queues": (".core.shared", "queues"),
+    # Parallel pools
+    "ThreadPoolExecutorPlus": (".pool.threadpool", "ThreadPoolExecutorPlus"),
+    "ProcessPoolExecutorPlus": (".pool.processpool", "ProcessPoolExecutorPlus"),
+    # Accelerated integrations
+    "NumpyAccelerator": (".integration.numpy_accel", "NumpyAccelerator"),
+    "PandasAccelerator": (".integration.pandas_accel", "PandasAccelerator"),
+    "SklearnAccelerator": (".integration.sklearn_accel", "SklearnAccelerator"),
+    # Expose key utilities for direct access
+    "parallelize": (".decorators", "parallelize"),
+    "profile_execution": (".decorators", "profile_execution"),
+}
+
+
+def __getattr__(name):
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import importlib
+    owner = importlib.import_module(module, __name__)
+    try:
+        value = getattr(owner, attr)
+    except AttributeError:
+        # ``from package import submodule``
+        value = importlib.import_module(f"{module}.{attr}", __name__)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "compute",
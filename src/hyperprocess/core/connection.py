@@ -1,17 +1,32 @@
 from __future__ import annotations
+import collections
+import errno
+import hashlib
+import ipaddress
+import itertools
+import os
+import select
 import sys
 import socket
-import time
+import struct
+import weakref
 from pathlib import Path
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Deque, Optional, Tuple, Union
 import secrets
 import hmac
 import logging
 import multiprocessing.connection as mp_conn
-from multiprocessing import AuthenticationError
+import multiprocessing.util as mp_util
+from multiprocessing import AuthenticationError, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 
 logger = logging.getLogger(__name__)
 BUFSIZE = 8192
+SOCKET_BUFSIZE = 256 * 1024  # minimum SO_RCVBUF/SO_SNDBUF for accepted TCP sockets
+PIPE_BUFSIZE = 1024 * 1024  # requested buffer size for one-way Pipe() socketpairs
+
+# Same-host default: Unix domain sockets skip the loopback TCP/IP stack
+default_family = 'AF_PIPE' if sys.platform == 'win32' else 'AF_UNIX'
 
 # Windows-specific imports (hidden from static checkers)
 if sys.platform == 'win32':
@@ -27,9 +42,9 @@ def arbitrary_address(family: str) -> Union[tuple[str, int], Path, str]:
     if family == 'AF_INET':
         return ('localhost', 0)
     if family == 'AF_UNIX':
-        base = Path.home() / ".hyperprocess"
-        base.mkdir(parents=True, exist_ok=True)  # ensure directory exists
-        return base / f"listener-{int(time.time()*1000)}.sock"
+        # Per-process temp dir (removed at exit) plus a random name, as
+        # multiprocessing does, so concurrent listeners never collide
+        return Path(mp_util.get_temp_dir()) / f"listener-{secrets.token_hex(8)}.sock"
     if family == 'AF_PIPE':
         return fr"\\.\pipe\hyperprocess-{secrets.token_hex(8)}"
     raise ValueError(f'Unrecognized family: {family}')
@@ -43,8 +58,8 @@ def address_type(addr: Any) -> str:
         return 'AF_INET'
     if isinstance(addr, Path):
         return 'AF_UNIX'
-    if isinstance(addr, str) and addr.startswith(r'\\'):
-        return 'AF_PIPE'
+    if isinstance(addr, str):
+        return 'AF_PIPE' if addr.startswith(r'\\') else 'AF_UNIX'
     raise ValueError(f'Unrecognized address type: {addr!r}')
 
 
@@ -61,20 +76,28 @@ class Listener:
         authkey: Optional[bytes] = None
     ) -> None:
         self.family = family or (
-            address and address_type(address)) or 'AF_INET'
+            address and address_type(address)) or default_family
         self.address = address or arbitrary_address(self.family)
         self.authkey = authkey
+        # Pre-keyed HMAC reused (via copy()) for every handshake
+        self._hmac_template = (
+            hmac.new(authkey, b'', 'sha256') if authkey else None)
+        self._challenges = ChallengeSource() if authkey else None
 
         if self.family == 'AF_PIPE':
             self._listener = PipeListener(self.address, backlog)
         else:
-            sock = socket.socket(getattr(socket, self.family))
+            sock = _new_socket(self.family)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            sock.bind(self.address)  # type: ignore[arg-type]
+            if self.family == 'AF_UNIX':
+                sock.bind(str(self.address))
+            else:
+                sock.bind(self.address)  # type: ignore[arg-type]
+                self.address = sock.getsockname()[:2]
             sock.listen(backlog)
             self._listener = sock
 
-    def accept(self) -> mp_conn.Connection:
+    def accept(self) -> Union[mp_conn.Connection, SharedMemoryChannel]:
         """
         Accept a connection and perform optional HMAC authentication.
         """
@@ -82,12 +105,24 @@ class Listener:
             conn = self._listener.accept()  # type: ignore[attr-defined]
         else:
             sock, _ = self._listener.accept()  # type: ignore[attr-defined]
-            conn = mp_conn.Connection(sock.fileno())
-            sock.close()
+            sock.setblocking(True)
+            if self.family == 'AF_INET':
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                for opt in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                    if sock.getsockopt(socket.SOL_SOCKET, opt) < SOCKET_BUFSIZE:
+                        sock.setsockopt(socket.SOL_SOCKET, opt, SOCKET_BUFSIZE)
+            elif hasattr(socket, 'SO_PASSCRED'):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_PASSCRED, 1)
+            # Hand the fd over to the Connection; closing the socket wrapper
+            # afterwards must not close the descriptor the Connection owns.
+            zerocopy = _enable_zerocopy(sock)
+            conn = mp_conn.Connection(sock.detach())
+            if zerocopy:
+                _zerocopy_state[conn] = _ZeroCopyState()
         if self.authkey:
-            deliver_challenge(conn, self.authkey)
-            answer_challenge(conn, self.authkey)
-        return conn
+            server_handshake(conn, self.authkey, self._hmac_template,
+                             self._challenges)
+        return _negotiate_shm(conn, server=True)
 
     def close(self) -> None:
         """
@@ -95,15 +130,25 @@ class Listener:
         """
         try:
             self._listener.close()  # type: ignore[attr-defined]
+            if self.family == 'AF_UNIX':
+                Path(self.address).unlink(missing_ok=True)
         except Exception as e:
             logger.debug("Error closing listener: %s", e)
 
 
+def _new_socket(family: str) -> socket.socket:
+    """
+    Create a close-on-exec stream socket for `family`.
+    """
+    sock_type = socket.SOCK_STREAM | getattr(socket, 'SOCK_CLOEXEC', 0)
+    return socket.socket(getattr(socket, family), sock_type)
+
+
 def Client(
     address: Any,
     family: Optional[str] = None,
     authkey: Optional[bytes] = None
-) -> mp_conn.Connection:
+) -> Union[mp_conn.Connection, SharedMemoryChannel]:
     """
     Connect to a Listener and perform optional authentication.
     """
@@ -111,19 +156,355 @@ def Client(
     if fam == 'AF_PIPE':
         conn = PipeConnection(address)  # type: ignore[call-arg]
     else:
-        with socket.create_connection(address) as sock:
-            conn = mp_conn.Connection(sock.fileno())
+        sock = _new_socket(fam)
+        try:
+            if fam == 'AF_UNIX':
+                sock.connect(str(address))
+            else:
+                sock.connect(address)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            sock.close()
+            raise
+        zerocopy = _enable_zerocopy(sock)
+        conn = mp_conn.Connection(sock.detach())
+        if zerocopy:
+            _zerocopy_state[conn] = _ZeroCopyState()
     if authkey:
-        answer_challenge(conn, authkey)
-        deliver_challenge(conn, authkey)
-    return conn
+        client_handshake(conn, authkey)
+    return _negotiate_shm(conn, server=False)
+
+
+# Zero-copy sends for large payloads on Linux sockets (MSG_ZEROCOPY)
+
+
+ZEROCOPY_THRESHOLD = 64 * 1024
+_SO_ZEROCOPY = getattr(socket, 'SO_ZEROCOPY', 60)
+_MSG_ZEROCOPY = getattr(socket, 'MSG_ZEROCOPY', 0x4000000)
+_MSG_ERRQUEUE = getattr(socket, 'MSG_ERRQUEUE', 0x2000)
+_SO_EE_ORIGIN_ZEROCOPY = 5
+_SOCK_EXTENDED_ERR = struct.Struct('=IBBBBII')
+
+
+class _ZeroCopyState:
+    """
+    Buffers pinned by in-flight MSG_ZEROCOPY sends on one connection.
+    """
+
+    def __init__(self) -> None:
+        self.seq = 0
+        self.inflight: Deque[Tuple[int, Any]] = collections.deque()
+
+
+_zerocopy_state: weakref.WeakKeyDictionary[
+    mp_conn.Connection, _ZeroCopyState] = weakref.WeakKeyDictionary()
+
+
+def _enable_zerocopy(sock: socket.socket) -> bool:
+    """
+    Turn on SO_ZEROCOPY for `sock`; return False where unsupported.
+
+    Peers on the same host are skipped: the kernel copies for them anyway,
+    and the completion notice only arrives once the peer has read the
+    data, which `send_large` would have to wait for.
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    if sock.family not in (socket.AF_INET, socket.AF_INET6):
+        return False
+    try:
+        peer = sock.getpeername()[0]
+        if (ipaddress.ip_address(peer).is_loopback
+                or peer == sock.getsockname()[0]):
+            return False
+    except (OSError, ValueError):
+        return False
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, _SO_ZEROCOPY, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _reap_zerocopy(sock: socket.socket, state: _ZeroCopyState) -> None:
+    """
+    Drain completion notices and drop buffers the kernel no longer pins.
+    """
+    while state.inflight:
+        try:
+            _, ancdata, _, _ = sock.recvmsg(
+                0, socket.CMSG_SPACE(_SOCK_EXTENDED_ERR.size),
+                _MSG_ERRQUEUE | socket.MSG_DONTWAIT)
+        except (BlockingIOError, InterruptedError):
+            return
+        for _, _, data in ancdata:
+            err = _SOCK_EXTENDED_ERR.unpack_from(data)
+            if err[1] != _SO_EE_ORIGIN_ZEROCOPY:
+                continue
+            last = err[6]
+            while state.inflight and state.inflight[0][0] <= last:
+                state.inflight.popleft()
+
+
+def _await_zerocopy(sock: socket.socket, state: _ZeroCopyState) -> None:
+    """
+    Block until every in-flight MSG_ZEROCOPY send on `sock` has completed.
+
+    Pending notices keep POLLERR raised on the socket, which would make
+    `poll()`/`wait()` report the connection readable with nothing to read,
+    so they must not be left behind.
+    """
+    poller = select.poll()
+    poller.register(sock, 0)  # POLLERR and POLLHUP are always reported
+    while state.inflight:
+        events = poller.poll()
+        _reap_zerocopy(sock, state)
+        if state.inflight and any(ev & select.POLLHUP for _, ev in events):
+            state.inflight.clear()  # peer gone; nothing more will complete
+
+
+def send_large(conn: Any, buf: Any) -> None:
+    """
+    Send a bytes-like object over `conn` avoiding payload copies where possible.
+
+    Shared-memory channels use their ring; the receiver then uses
+    `SharedMemoryChannel.recv_large`. Linux TCP sockets to a non-loopback
+    peer opened by `Listener` or `Client` send payloads of at least
+    `ZEROCOPY_THRESHOLD` bytes with MSG_ZEROCOPY and return once the kernel
+    reports the transfer complete. Everything else goes through
+    `conn.send_bytes`. On plain connections the receiver uses `recv_bytes`.
+    """
+    if isinstance(conn, SharedMemoryChannel):
+        conn.send_large(buf)
+        return
+    view = memoryview(buf).cast('B')
+    size = view.nbytes
+    state = _zerocopy_state.get(conn)
+    if state is None or size < ZEROCOPY_THRESHOLD:
+        conn.send_bytes(view)
+        return
+    # Same framing as Connection._send_bytes so the peer can recv_bytes().
+    if size > 0x7fffffff:
+        header = struct.pack('!iQ', -1, size)
+    else:
+        header = struct.pack('!i', size)
+    sock = socket.socket(fileno=conn.fileno())
+    try:
+        _reap_zerocopy(sock, state)
+        try:
+            sent = sock.sendmsg([header, view], [], _MSG_ZEROCOPY)
+        except OSError as e:
+            if e.errno not in (errno.ENOBUFS, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+            conn.send_bytes(view)
+            return
+        # The header is pinned by the kernel too, so keep it alive as well.
+        state.inflight.append((state.seq, (header, buf)))
+        state.seq = (state.seq + 1) & 0xffffffff
+        if sent < len(header):
+            sock.sendall(header[sent:])
+            sent = len(header)
+        if sent - len(header) < size:
+            sock.sendall(view[sent - len(header):])
+        _await_zerocopy(sock, state)
+    finally:
+        sock.detach()
 
 
 def Pipe(duplex: bool = True) -> Tuple[mp_conn.Connection, mp_conn.Connection]:
     """
     Return a pair of Connection objects connected by a pipe.
+
+    On POSIX a one-way pipe is a unix stream socketpair with `PIPE_BUFSIZE`
+    buffers rather than an os.pipe(), whose 64 KiB buffer splits larger
+    messages into many writes and wake-ups.
     """
-    return mp_conn.Pipe(duplex)
+    if duplex or sys.platform == 'win32':
+        return mp_conn.Pipe(duplex)
+    r, w = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    r.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, PIPE_BUFSIZE)
+    w.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, PIPE_BUFSIZE)
+    return (mp_conn.Connection(r.detach(), writable=False),
+            mp_conn.Connection(w.detach(), readable=False))
+
+# Shared-memory transport for large payloads (opt-in via HYPERPROCESS_SHM=1)
+
+
+SHM_THRESHOLD = 64 * 1024
+SHM_SLOTS = 8
+SHM_SLOT_SIZE = 2 * 1024 * 1024
+_SHM_HEADER = 64  # per-slot busy flags, padded to a cache line
+
+_TAG_INLINE = 0      # payload follows the tag in the same message
+_TAG_SHM = 1         # payload lives in a slot of the sender's ring
+_TAG_FOLLOWS = 2     # payload is sent as the next message
+_DESCRIPTOR = struct.Struct('!BII')
+
+
+def _shm_enabled() -> bool:
+    return os.environ.get('HYPERPROCESS_SHM') == '1'
+
+
+class SharedMemoryChannel:
+    """
+    Connection wrapper that moves large payloads through shared memory.
+
+    Each side owns a ring of `SHM_SLOTS` slots of `SHM_SLOT_SIZE` bytes and
+    attaches to the peer's ring; `send_large` copies the payload into a free
+    slot and sends only a small descriptor over the wrapped connection.
+    Payloads below `SHM_THRESHOLD`, larger than a slot, or sent while every
+    slot is still held by the peer fall back to the connection itself.
+
+    Views returned by `recv_large` point straight into the peer's ring and
+    stay valid until the next `recv_large` call. All other attributes are
+    delegated to the wrapped connection.
+    """
+
+    def __init__(self, conn: mp_conn.Connection) -> None:
+        self._conn = conn
+        self._out = SharedMemory(
+            create=True, size=_SHM_HEADER + SHM_SLOTS * SHM_SLOT_SIZE)
+        self._out.buf[:_SHM_HEADER] = bytes(_SHM_HEADER)
+        self._in: Optional[SharedMemory] = None
+        self._next = 0
+        self._held: Optional[int] = None
+        self._view: Optional[memoryview] = None
+
+    @property
+    def name(self) -> str:
+        return self._out.name
+
+    def attach(self, name: str, tracker: Optional[str] = None) -> None:
+        """
+        Attach to the peer's ring published under `name`.
+
+        `tracker` is the peer's `_tracker_id()`. The peer owns (and unlinks)
+        the segment, so our own resource tracker must forget it; but when
+        both sides share one tracker, that registration is the owner's too
+        and is left alone.
+        """
+        try:
+            self._in = SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+            return
+        except TypeError:  # Python < 3.13
+            self._in = SharedMemory(name=name)
+        if sys.platform != 'win32' and tracker != _tracker_id():
+            resource_tracker.unregister(self._in._name, 'shared_memory')  # type: ignore[attr-defined]
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._conn, attr)
+
+    def send_large(self, buf: Any) -> None:
+        """
+        Send a bytes-like object, through shared memory when worthwhile.
+        """
+        view = memoryview(buf).cast('B')
+        size = view.nbytes
+        if size < SHM_THRESHOLD:
+            self._conn.send_bytes(bytes((_TAG_INLINE,)) + view)
+            return
+        slot = self._next
+        flags = self._out.buf
+        if size > SHM_SLOT_SIZE or flags[slot]:
+            self._conn.send_bytes(bytes((_TAG_FOLLOWS,)))
+            self._conn.send_bytes(view)
+            return
+        start = _SHM_HEADER + slot * SHM_SLOT_SIZE
+        flags[start:start + size] = view
+        flags[slot] = 1
+        self._next = (slot + 1) % SHM_SLOTS
+        self._conn.send_bytes(_DESCRIPTOR.pack(_TAG_SHM, slot, size))
+
+    def recv_large(self) -> memoryview:
+        """
+        Receive a payload sent with `send_large` as a memoryview.
+        """
+        self._release()
+        msg = self._conn.recv_bytes()
+        tag = msg[0]
+        if tag == _TAG_INLINE:
+            return memoryview(msg)[1:]
+        if tag == _TAG_FOLLOWS:
+            return memoryview(self._conn.recv_bytes())
+        _, slot, size = _DESCRIPTOR.unpack(msg)
+        assert self._in is not None, 'peer ring not attached'
+        start = _SHM_HEADER + slot * SHM_SLOT_SIZE
+        self._held = slot
+        self._view = self._in.buf[start:start + size]
+        return self._view
+
+    def _release(self) -> None:
+        """
+        Hand the slot behind the last received view back to the peer.
+        """
+        if self._held is None:
+            return
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._in is not None:
+            self._in.buf[self._held] = 0
+        self._held = None
+
+    def close(self) -> None:
+        """
+        Close the connection and both rings, unlinking the owned one.
+        """
+        self._release()
+        self._conn.close()
+        if self._in is not None:
+            self._in.close()
+        self._out.close()
+        self._out.unlink()
+
+
+def _tracker_id() -> str:
+    """
+    Identify this process's resource tracker by its pipe.
+
+    Processes sharing a tracker (forked or spawned from one parent) hold
+    the same pipe, so its device and inode match across them.
+    """
+    if sys.platform == 'win32':
+        return ''
+    st = os.fstat(resource_tracker.getfd())
+    return f'{st.st_dev}:{st.st_ino}'
+
+
+def _negotiate_shm(
+    conn: mp_conn.Connection,
+    server: bool
+) -> Union[mp_conn.Connection, SharedMemoryChannel]:
+    """
+    Agree with the peer on the shared-memory transport.
+
+    Each side sends one capability byte, set when ``HYPERPROCESS_SHM=1``
+    in its environment; rings are only exchanged when both sides offer
+    them, otherwise `conn` is returned unchanged.
+    """
+    offer = _shm_enabled()
+    conn.send_bytes(b'\x01' if offer else b'\x00')
+    accepted = conn.recv_bytes() == b'\x01'
+    if offer and accepted:
+        return _shm_handshake(conn, server)
+    return conn
+
+
+def _shm_handshake(conn: mp_conn.Connection, server: bool) -> SharedMemoryChannel:
+    """
+    Exchange ring names and tracker ids over `conn` and return the wrapping channel.
+    """
+    channel = SharedMemoryChannel(conn)
+    mine = f'{channel.name} {_tracker_id()}'.encode()
+    if server:
+        conn.send_bytes(mine)
+        peer = conn.recv_bytes().decode()
+    else:
+        peer = conn.recv_bytes().decode()
+        conn.send_bytes(mine)
+    name, _, tracker = peer.partition(' ')
+    channel.attach(name, tracker)
+    return channel
 
 # Authentication primitives
 
@@ -131,27 +512,126 @@ def Pipe(duplex: bool = True) -> Tuple[mp_conn.Connection, mp_conn.Connection]:
 MESSAGE_LENGTH = 32
 
 
-def deliver_challenge(conn: mp_conn.Connection, authkey: bytes) -> None:
+def _hmac_digest(
+    authkey: bytes,
+    message: bytes,
+    template: Optional[hmac.HMAC] = None
+) -> bytes:
+    """
+    Return HMAC-SHA256 of `message`, reusing a pre-keyed template if given.
+    """
+    if template is None:
+        return hmac.new(authkey, message, 'sha256').digest()
+    h = template.copy()
+    h.update(message)
+    return h.digest()
+
+
+class ChallengeSource:
+    """
+    Syscall-free generator of unique, unpredictable handshake challenges.
+
+    Challenges are BLAKE2b(counter) keyed with a secret drawn once from the
+    OS RNG, i.e. a keyed PRF over a counter; the key is refreshed every
+    `RESEED_INTERVAL` challenges.
+    """
+
+    RESEED_INTERVAL = 1 << 20
+
+    def __init__(self) -> None:
+        self._reseed()
+
+    def _reseed(self) -> None:
+        self._key = secrets.token_bytes(32)
+        self._counter = itertools.count()
+
+    def next(self) -> bytes:
+        n = next(self._counter)
+        if n >= self.RESEED_INTERVAL:
+            self._reseed()
+            n = next(self._counter)
+        return hashlib.blake2b(
+            n.to_bytes(8, 'little'), key=self._key,
+            digest_size=MESSAGE_LENGTH).digest()
+
+
+def deliver_challenge(
+    conn: mp_conn.Connection,
+    authkey: bytes,
+    hmac_template: Optional[hmac.HMAC] = None,
+    challenges: Optional[ChallengeSource] = None
+) -> None:
     """
     Send a random challenge string and verify HMAC response.
     """
     assert isinstance(authkey, (bytes, bytearray))
-    challenge = secrets.token_bytes(MESSAGE_LENGTH)
-    # secure token source :contentReference[oaicite:5]{index=5}
+    if challenges is None:
+        challenge = secrets.token_bytes(MESSAGE_LENGTH)
+    else:
+        challenge = challenges.next()
     conn.send_bytes(challenge)
-    expected = hmac.new(authkey, challenge, 'sha256').digest()
+    expected = _hmac_digest(authkey, challenge, hmac_template)
     response = conn.recv_bytes()
-    if response != expected:
+    if not hmac.compare_digest(response, expected):
         raise AuthenticationError('Bad response')
     conn.send_bytes(b'WELCOME')
 
 
-def answer_challenge(conn: mp_conn.Connection, authkey: bytes) -> None:
+def answer_challenge(
+    conn: mp_conn.Connection,
+    authkey: bytes,
+    hmac_template: Optional[hmac.HMAC] = None
+) -> None:
     """
     Receive challenge and respond with correct HMAC digest.
     """
     data = conn.recv_bytes()
-    expected = hmac.new(authkey, data, 'sha256').digest()
+    expected = _hmac_digest(authkey, data, hmac_template)
     conn.send_bytes(expected)
     if conn.recv_bytes() != b'WELCOME':
         raise AuthenticationError('Authentication failed')
+
+
+def server_handshake(
+    conn: mp_conn.Connection,
+    authkey: bytes,
+    hmac_template: Optional[hmac.HMAC] = None,
+    challenges: Optional[ChallengeSource] = None
+) -> None:
+    """
+    Mutual authentication, server side, in three messages instead of six.
+
+    The client's response and its own challenge arrive in one message, and
+    the server's response doubles as the WELCOME; a client that rejects the
+    server simply closes the connection.
+    """
+    assert isinstance(authkey, (bytes, bytearray))
+    if challenges is None:
+        challenge = secrets.token_bytes(MESSAGE_LENGTH)
+    else:
+        challenge = challenges.next()
+    conn.send_bytes(challenge)
+    message = conn.recv_bytes()
+    expected = _hmac_digest(authkey, challenge, hmac_template)
+    response, peer_challenge = message[:len(expected)], message[len(expected):]
+    if len(peer_challenge) != MESSAGE_LENGTH or \
+            not hmac.compare_digest(response, expected):
+        conn.close()
+        raise AuthenticationError('Bad response')
+    conn.send_bytes(_hmac_digest(authkey, peer_challenge, hmac_template))
+
+
+def client_handshake(conn: mp_conn.Connection, authkey: bytes) -> None:
+    """
+    Mutual authentication, client side; counterpart of `server_handshake`.
+    """
+    assert isinstance(authkey, (bytes, bytearray))
+    challenge = secrets.token_bytes(MESSAGE_LENGTH)
+    conn.send_bytes(_hmac_digest(authkey, conn.recv_bytes()) + challenge)
+    try:
+        response = conn.recv_bytes()
+    except (EOFError, ConnectionResetError):
+        raise AuthenticationError('Authentication failed') from None
+    if not hmac.compare_digest(response, _hmac_digest(authkey, challenge)):
+        conn.close()
+        raise AuthenticationError('Bad response')
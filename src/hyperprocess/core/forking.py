@@ -1,12 +1,17 @@
 from __future__ import annotations
 import os
 import sys
+import threading
 import signal
 import warnings
+import io
 import multiprocessing as mp
+import multiprocessing.reduction as mp_reduction
+import pickle
 from pickle import Pickler
+import collections
 import copyreg
-from typing import Any, Callable, Dict, Tuple, Type, Optional
+from typing import Any, Callable, Dict, List, Tuple, Type, Optional
 from functools import partial
 
 
@@ -14,14 +19,25 @@ class ForkingPickler(Pickler):
     """
     A Pickler subclass with its own dispatch_table, used by hyperprocess
     to support pickling of methods, partials, and other callables.
+
+    The table is a live view over our reducers, multiprocessing's own
+    (sockets, connections, ...) and copyreg's, in that order, so reducers
+    registered with multiprocessing after import are still honoured
+    without copying the tables for every pickler.
     """
-    # type: ignore[attr-defined
-    dispatch_table: Dict[
+    _extra_reducers: Dict[
         Type[Any],
         Callable[[Any], Tuple[Callable, Tuple[Any, ...]]]
-    ] = copyreg.dispatch_table.copy() 
+    ] = {}
+    dispatch_table = collections.ChainMap(
+        _extra_reducers,
+        mp_reduction.ForkingPickler._extra_reducers,
+        copyreg.dispatch_table)
 
-    dispatch = Pickler.dispatch.copy()
+    def __init__(self, file: Any, protocol: Optional[int] = None, **kwargs: Any) -> None:
+        if protocol is None:
+            protocol = pickle.HIGHEST_PROTOCOL
+        super().__init__(file, protocol, **kwargs)
 
     @classmethod
     def register(
@@ -32,12 +48,7 @@ class ForkingPickler(Pickler):
         """
         Register a reduction function for `typ` in this pickler's dispatch_table.
         """
-        cls.dispatch_table[typ] = reduce_func
-
-        def dispatcher(self: ForkingPickler, obj: Any) -> None:
-            rv = reduce_func(obj)
-            self.save_reduce(obj=obj, *rv)
-        cls.dispatch[typ] = dispatcher
+        cls._extra_reducers[typ] = reduce_func
 
 
 # Get multiprocessing context
@@ -52,7 +63,7 @@ if sys.platform == 'darwin' and ctx.get_start_method() == 'fork':
     )
 
 __all__ = ['Popen', 'assert_spawning', 'exit',
-           'duplicate', 'close', 'ForkingPickler']
+           'duplicate', 'close', 'ForkingPickler', 'dumps', 'loads']
 
 # System functions
 exit = os._exit
@@ -62,16 +73,90 @@ close = os.close
 
 def assert_spawning(self: Any) -> None:
     """Raise RuntimeError if not currently spawning a new process."""
-    if not Popen.thread_is_spawning():
+    if mp.context.get_spawning_popen() is None:
         raise RuntimeError(
             f"{type(self).__name__} objects should only be shared "
             "between processes through inheritance"
         )
 
 
-def _reduce_method(m: Any) -> tuple[Any, tuple[Any, ...]]:
-    """Reduce method objects for pickling."""
-    return getattr, (m.__self__ or m.__objclass__, m.__name__)
+# Pickles up to this size are copied out of the per-thread stream, which is
+# then reused; larger ones keep the stream, so it never pins a big allocation
+_REUSE_LIMIT = 64 * 1024
+
+
+class _ThreadPickler(threading.local):
+    """
+    Per-thread stream and ForkingPickler reused by `dumps`.
+
+    Building a Pickler and a BytesIO costs more than pickling a small
+    object, so each thread keeps one pair and clears it between calls.
+    """
+
+    def __init__(self) -> None:
+        self.buffers: Optional[List[pickle.PickleBuffer]] = None
+        self.busy = False
+        self.reset()
+
+    def reset(self) -> None:
+        self.stream = io.BytesIO()
+        self.pickler = ForkingPickler(self.stream, buffer_callback=self.out_of_band)
+
+    def out_of_band(self, pb: pickle.PickleBuffer) -> bool:
+        if self.buffers is None:
+            return True
+        try:
+            pb.raw()
+        except BufferError:
+            return True  # non-contiguous: serialize in-band
+        self.buffers.append(pb)
+        return False
+
+
+_thread_pickler = _ThreadPickler()
+
+
+def dumps(
+    obj: Any,
+    buffers: Optional[List[pickle.PickleBuffer]] = None,
+    reserve: int = 0
+) -> memoryview:
+    """
+    Pickle `obj` with the highest protocol.
+
+    If `buffers` is given, contiguous PickleBuffer payloads (e.g. NumPy
+    arrays) are appended to it out-of-band instead of being copied into
+    the returned pickle; pass them back to `loads`. The returned view
+    starts with `reserve` zero bytes, room for a caller's header.
+    """
+    state = _thread_pickler
+    if state.busy:
+        # Called from a reducer while this thread is already pickling
+        state = _ThreadPickler()
+    stream = state.stream
+    state.busy = True
+    state.buffers = buffers
+    try:
+        stream.seek(0)
+        stream.truncate()
+        stream.write(bytes(reserve))
+        state.pickler.clear_memo()
+        state.pickler.dump(obj)
+    finally:
+        state.buffers = None
+        state.busy = False
+    if stream.tell() > _REUSE_LIMIT:
+        state.reset()
+        return stream.getbuffer()
+    return memoryview(bytearray(stream.getbuffer()))
+
+
+loads = pickle.loads
+
+
+def _reduce_method_descriptor(m: Any) -> tuple[Any, tuple[Any, ...]]:
+    """Reduce unbound builtin method descriptors for pickling."""
+    return getattr, (m.__objclass__, m.__name__)
 
 
 def _rebuild_partial(
@@ -89,7 +174,6 @@ def _reduce_partial(p: partial) -> tuple[Any, tuple[Any, ...]]:
 
 
 # Register reduction functions
-ForkingPickler.register(type(ForkingPickler.save), _reduce_method)
-ForkingPickler.register(type(list.append), _reduce_method)
-ForkingPickler.register(type(int.__add__), _reduce_method)
+ForkingPickler.register(type(list.append), _reduce_method_descriptor)
+ForkingPickler.register(type(int.__add__), _reduce_method_descriptor)
 ForkingPickler.register(partial, _reduce_partial)
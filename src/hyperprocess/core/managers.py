@@ -1,9 +1,13 @@
 from __future__ import annotations
 import queue
 import threading
+import types
 import multiprocessing
-from multiprocessing.managers import SyncManager
-from typing import Any, Optional, Tuple
+from multiprocessing.managers import NamespaceProxy, SyncManager
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    from hyperprocess.core.queue import Queue as _FastQueue
 
 __all__ = ['HyperSyncManager', 'get_manager']
 
@@ -14,7 +18,24 @@ class HyperSyncManager(SyncManager):
     A SyncManager subclass for Hyperprocess providing shared
     Queue, Lock, Event, Semaphore, Value, Array, and Namespace.
     """
-    pass
+
+    def FastQueue(
+        self,
+        maxsize: int = 0,
+        ring_bytes: Optional[int] = None
+    ) -> _FastQueue:
+        """
+        Create a local shared-memory Queue instead of a manager-hosted one.
+
+        Puts and gets go straight through the shared ring with no round trip
+        to the manager process. Like ``multiprocessing.Queue``, it is shared
+        with children by passing it to them when they start. ``ring_bytes``
+        defaults to the queue's ``DEFAULT_RING_BYTES``.
+        """
+        # Imported here: importing the queue module at load time would fix
+        # the global start method for everything that imports the managers.
+        from hyperprocess.core.queue import DEFAULT_RING_BYTES, Queue
+        return Queue(maxsize, ring_bytes=ring_bytes or DEFAULT_RING_BYTES)
 
 
     # pylint: disable=no-member
@@ -34,7 +55,7 @@ HyperSyncManager.register('Event', threading.Event)
 # Condition variable
 HyperSyncManager.register('Condition', threading.Condition)
 # Simple namespace :contentReference[oaicite:6]{index=6}
-HyperSyncManager.register('Namespace', dict)
+HyperSyncManager.register('Namespace', types.SimpleNamespace, NamespaceProxy)
 # Shared ctypes Value :contentReference[oaicite:7]{index=7}
 HyperSyncManager.register('Value', multiprocessing.Value)
 # Shared ctypes Array
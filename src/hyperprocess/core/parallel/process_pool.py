@@ -4,21 +4,43 @@ Process Pool implementation for HyperProcess.
 Provides a high-level, context-managed API for multiprocessing
 using ProcessPoolExecutor under the hood.
 """
-from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+import atexit
 import concurrent.futures
-from multiprocessing import get_context, cpu_count
+import functools
+import inspect
+import io
+import itertools
+import math
+import os
+import pickle
+import queue
+import sys
+import threading
+import time
+import types
+import weakref
+from multiprocessing import get_context
+from multiprocessing import reduction as mp_reduction
+from multiprocessing.shared_memory import SharedMemory
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
+    Dict,
     Iterable,
     Iterator,
+    Literal,
     Optional,
     TypeVar,
     List,
+    Set,
     Tuple
 )
 from collections.abc import Sized
 from contextlib import AbstractContextManager
+from hyperprocess.core.managers import HyperSyncManager, get_manager
+from hyperprocess.core.parallel.thread_pool import _amap_ordered, _collect, _invoke_callback
 
 # Define type variables
 T = TypeVar('T')
@@ -26,6 +48,80 @@ R = TypeVar('R')
 _T = TypeVar('_T')
 
 
+def _cgroup_cpu_limit() -> Optional[int]:
+    """
+    Return the CPU quota imposed by cgroup v2 or v1, or None if unlimited.
+    """
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()[:2]
+        if quota != 'max':
+            return max(1, math.ceil(int(quota) / int(period)))
+        return None
+    except (OSError, ValueError):
+        pass
+    try:
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+            quota_us = int(f.read())
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+            period_us = int(f.read())
+    except (OSError, ValueError):
+        return None
+    if quota_us <= 0 or period_us <= 0:
+        return None
+    return max(1, math.ceil(quota_us / period_us))
+
+
+def _available_cpus() -> int:
+    """
+    Number of CPUs this process may actually run on, honouring affinity and cgroup quotas.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        count = len(os.sched_getaffinity(0))
+    else:
+        count = os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    return min(count, limit) if limit else count
+
+
+# Default worker count, computed once at import
+_DEFAULT_WORKERS = _available_cpus()
+
+# forkserver forks workers from a warm helper instead of re-importing per worker
+_DEFAULT_START_METHOD = 'forkserver' if sys.platform.startswith('linux') else 'spawn'
+
+# Objects installed once per worker by Pool(shared=...)
+_WORKER_SHARED: Dict[str, Any] = {}
+
+# Tasks a worker runs before it is replaced, unless the caller says otherwise
+_DEFAULT_MAX_TASKS_PER_CHILD = 1000
+
+# Outstanding chunk futures allowed per worker in imap_unordered
+_BACKLOG_FACTOR = 2
+
+# Unsized inputs up to this many items are materialised to size their chunks
+_PEEK_LIMIT = 4096
+
+# How often a manager-backed map checks its chunk futures for errors
+_RESULT_POLL = 0.1
+
+# Call/result pipe capacity requested on Linux (the default is 64 KiB)
+_PIPE_SIZE = 1 << 20
+# Upper bound on threads used to start workers concurrently
+_MAX_STARTERS = 16
+
+# Smallest ndarray that map_shared moves through shared memory
+_SHARE_THRESHOLD = 64 * 1024
+
+# Types multiprocessing reduces without handing over a file descriptor
+_FD_FREE_TYPES = frozenset((
+    types.MethodType, type(list.append), type(int.__add__), functools.partial))
+
+# Process-wide pools handed out by get_pool()
+_POOLS: Dict[Tuple[Any, ...], "Pool"] = {}
+_POOLS_LOCK = threading.Lock()
+
+
 class Pool(ProcessPoolExecutor, AbstractContextManager):
     """
     A context-managed process pool supporting sync and async map/apply.
@@ -36,20 +132,55 @@ class Pool(ProcessPoolExecutor, AbstractContextManager):
         processes: Optional[int] = None,
         initializer: Optional[Callable[..., Any]] = None,
         initargs: Tuple[Any, ...] = (),
-        max_tasks_per_child: Optional[int] = None,
-        start_method: str = 'spawn'
+        max_tasks_per_child: Optional[int] = _DEFAULT_MAX_TASKS_PER_CHILD,
+        start_method: Optional[str] = None,
+        shared: Optional[Dict[str, Any]] = None,
+        preload_modules: Optional[List[str]] = None,
+        result_queue: Literal['pipe', 'manager'] = 'pipe'
     ):
         """
         Custom ProcessPoolExecutor with support for initializer and initargs.
 
-        :param processes: Number of worker processes to use. Defaults to the number of CPU cores.
+        :param processes: Number of worker processes to use. Defaults to the CPUs available to this process (affinity and cgroup quota).
         :param initializer: A callable invoked by each worker process when it starts.
         :param initargs: A tuple of arguments passed to the initializer.
         :param max_tasks_per_child: Maximum number of tasks a worker process can execute before it will exit and be replaced.
+            Defaults to 1000, which bounds slow memory growth without paying worker start-up often; pass None for
+            workers that never recycle. 'fork' pools cannot recycle workers and default to None.
         :param start_method: Method used to start the worker processes. Common values are 'fork', 'spawn', or 'forkserver'.
+            Defaults to 'forkserver' on Linux and 'spawn' elsewhere.
+        :param shared: Named objects installed once in every worker; tasks submitted with
+            ``apply_async(..., shared=names)`` receive them as keyword arguments without re-pickling.
+        :param preload_modules: Modules the forkserver imports once before forking workers, so they are
+            shared copy-on-write instead of imported by every worker. Only takes effect before the
+            forkserver process has started.
+        :param result_queue: How ``map`` and ``imap_unordered`` bring results back. ``'pipe'`` uses the
+            executor's result pipe. ``'manager'`` has workers put each chunk's results on a
+            ``HyperSyncManager`` queue (started lazily), trading one proxy round-trip per chunk for
+            taking large results off the executor's pickle-and-pipe path.
         """
-        max_workers = processes or cpu_count()
-        ctx = get_context(start_method)
+        if result_queue not in ('pipe', 'manager'):
+            raise ValueError(f"result_queue must be 'pipe' or 'manager', not {result_queue!r}")
+        self._result_transport = result_queue
+        self._persistent = False
+        self._manager: Optional[HyperSyncManager] = None
+        max_workers = processes or _DEFAULT_WORKERS
+        ctx = get_context(start_method or _DEFAULT_START_METHOD)
+        if preload_modules and ctx.get_start_method() == 'forkserver':
+            ctx.set_forkserver_preload(preload_modules)
+        if (ctx.get_start_method() == 'fork'
+                and max_tasks_per_child == _DEFAULT_MAX_TASKS_PER_CHILD):
+            max_tasks_per_child = None
+        if shared:
+            initializer, initargs = _init_shared, (shared, initializer, initargs)
+        if initargs and ctx.get_start_method() != 'fork':
+            # Pickle once here instead of once per spawned worker. Objects
+            # that may only be pickled while spawning (locks, queues) or
+            # that carry a file descriptor (connections, sockets) keep the
+            # per-worker path, where multiprocessing duplicates them.
+            payload = _dumps_initializer(initializer, initargs)
+            if payload is not None:
+                initializer, initargs = _init_pickled, (payload,)
         super().__init__(
             max_workers=max_workers,
             mp_context=ctx,
@@ -57,6 +188,44 @@ class Pool(ProcessPoolExecutor, AbstractContextManager):
             initargs=initargs,
             max_tasks_per_child=max_tasks_per_child
         )
+        _grow_pipe(self._call_queue._writer)
+        _grow_pipe(self._result_queue._writer)
+
+    def _adjust_process_count(self) -> None:
+        # The first time workers are needed, start all of them concurrently:
+        # each spawn/forkserver start is mostly waiting on the child, so
+        # starting them one per submit() serialises that latency.
+        if (self._processes or self._max_workers < 2
+                or not self._safe_to_dynamically_spawn_children):
+            super()._adjust_process_count()
+            return
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, _MAX_STARTERS)) as starter:
+            for fut in [starter.submit(self._spawn_process)
+                        for _ in range(self._max_workers)]:
+                fut.result()
+
+    def warm(self, preload: Callable[[], Any], name: str = 'state') -> None:
+        """
+        Build per-worker state once per worker instead of once per task.
+
+        ``preload`` is pickled once here and called once in every worker as
+        it starts; its result is installed like ``Pool(shared=...)`` objects,
+        so tasks submitted with ``apply_async(..., shared=(name,))`` receive
+        it as a keyword argument. Must be called before any task is
+        submitted. spawn/forkserver workers are started immediately.
+
+        :param preload: Zero-argument picklable callable that builds the state.
+        :param name: Keyword under which tasks receive the state.
+        """
+        if self._processes:
+            raise RuntimeError("warm() must be called before the pool starts its workers")
+        payload = pickle.dumps(preload, pickle.HIGHEST_PROTOCOL)
+        self._initializer, self._initargs = _warm_init, (
+            payload, name, self._initializer, self._initargs)
+        if self._safe_to_dynamically_spawn_children:
+            with self._shutdown_lock:
+                self._adjust_process_count()
+                self._start_executor_manager_thread()
 
     def __enter__(self) -> "Pool":
         return self
@@ -67,15 +236,76 @@ class Pool(ProcessPoolExecutor, AbstractContextManager):
         exc_val: Any,
         exc_tb: Any
     ) -> None:
-        # Ensure clean shutdown
-        self.shutdown(wait=True)
+        # Pools from get_pool() outlive the with-block; the rest shut down here
+        if not self._persistent:
+            self.shutdown(wait=True)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def _imap_managed(
+        self,
+        func: Callable[..., R],
+        iterable: Iterable[Any],
+        chunksize: int,
+        ordered: bool,
+        star: bool = False,
+        timeout: Optional[float] = None
+    ) -> Iterator[R]:
+        """
+        Chunked map whose results come back through a manager queue.
+
+        At most ``max_workers * _BACKLOG_FACTOR`` chunks are outstanding.
+        Chunk futures are polled while waiting so that worker errors surface
+        instead of leaving the caller blocked on the queue.
+        """
+        if self._manager is None:
+            self._manager = get_manager()
+        results = self._manager.Queue()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        it = iter(iterable)
+        limit = self._max_workers * _BACKLOG_FACTOR
+        pending: Dict[int, Future] = {}
+        ready: Dict[int, List[R]] = {}
+        submitted = next_idx = 0
+        while True:
+            while len(pending) < limit:
+                chunk = list(itertools.islice(it, chunksize))
+                if not chunk:
+                    break
+                pending[submitted] = self.submit(
+                    _run_chunk_to_queue, func, chunk, results, submitted, star)
+                submitted += 1
+            if not pending:
+                return
+            try:
+                idx, values = results.get(timeout=_RESULT_POLL)
+            except queue.Empty:
+                for fut in pending.values():
+                    if fut.done() and fut.exception() is not None:
+                        raise fut.exception()
+                if deadline is not None and time.monotonic() > deadline:
+                    raise concurrent.futures.TimeoutError
+                continue
+            del pending[idx]
+            if not ordered:
+                yield from values
+                continue
+            ready[idx] = values
+            while next_idx in ready:
+                yield from ready.pop(next_idx)
+                next_idx += 1
 
     def map(
         self,
         fn: Callable[..., _T],
         *iterables: Iterable[Any],
         timeout: Optional[float] = None,
-        chunksize: int = 1
+        chunksize: Optional[int] = None,
+        bound: str = 'compute'
     ) -> Iterator[_T]:
         """
         Apply a function to every item of the given iterables, yielding the results.
@@ -83,10 +313,83 @@ class Pool(ProcessPoolExecutor, AbstractContextManager):
         :param fn: The function to apply to the items.
         :param iterables: One or more iterable arguments that supply the data to process.
         :param timeout: The maximum number of seconds to wait. If None, then there is no limit.
-        :param chunksize: The size of the chunks the iterable will be split into and submitted to the process pool.
+        :param chunksize: The size of the chunks the iterable will be split into and submitted
+            to the process pool. Defaults to a size derived from the input length and worker count.
+        :param bound: Workload hint for the default chunksize: ``'compute'`` (several chunks
+            per worker, for load balance) or ``'memory'`` (one chunk per worker).
         :return: An iterator equivalent to map(fn, *iterables) but the calls may be evaluated out-of-order.
         """
-        return super().map(fn, *iterables, timeout=timeout, chunksize=chunksize)
+        if chunksize is None and iterables:
+            first = _peek_sized(iterables[0])
+            iterables = (first,) + iterables[1:]
+            chunksize = _calculate_chunksize(first, self._max_workers, bound)
+        if self._result_transport == 'manager':
+            return self._imap_managed(fn, zip(*iterables), chunksize or 1, ordered=True,
+                                      star=True, timeout=timeout)
+        return super().map(fn, *iterables, timeout=timeout, chunksize=chunksize or 1)
+
+    def map_list(
+        self,
+        fn: Callable[..., _T],
+        *iterables: Iterable[Any],
+        timeout: Optional[float] = None,
+        chunksize: Optional[int] = None,
+        bound: str = 'compute'
+    ) -> List[_T]:
+        """
+        Like map(), but block until every result is ready and return them as a list.
+        """
+        return list(self.map(fn, *iterables, timeout=timeout, chunksize=chunksize,
+                             bound=bound))
+
+    def map_shared(
+        self,
+        func: Callable[..., R],
+        iterable: Iterable[Any],
+        chunksize: Optional[int] = None
+    ) -> List[R]:
+        """
+        Like map_list(), but large NumPy array arguments travel through shared memory.
+
+        Each item of ``iterable`` is a tuple of arguments for ``func`` (any
+        other item is a single argument). Arrays of at least
+        ``_SHARE_THRESHOLD`` bytes are copied once into a ``SharedMemory``
+        block, once per distinct array however many calls use it, and
+        workers receive an ndarray over that block instead of an unpickled
+        copy. ``func`` must not keep references to those arrays after it
+        returns; the blocks are unlinked before this method returns.
+
+        :param func: The function to apply.
+        :param iterable: Argument tuples (or single arguments), one per call.
+        :param chunksize: Passed on to ``map``.
+        :return: The results, in input order.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        blocks: Dict[int, Tuple[Any, SharedMemory, _SharedArray]] = {}
+
+        def share(arg: Any) -> Any:
+            if np is None or not isinstance(arg, np.ndarray) or arg.nbytes < _SHARE_THRESHOLD:
+                return arg
+            entry = blocks.get(id(arg))
+            if entry is None:
+                shm = SharedMemory(create=True, size=arg.nbytes)
+                np.ndarray(arg.shape, arg.dtype, buffer=shm.buf)[...] = arg
+                # Keep `arg` alive so its id() is not reused by a later array
+                entry = blocks[id(arg)] = (arg, shm, _SharedArray(shm.name, arg.shape, arg.dtype))
+            return entry[2]
+
+        calls = [tuple(map(share, item if isinstance(item, tuple) else (item,)))
+                 for item in iterable]
+        try:
+            return self.map_list(functools.partial(_reattach_and_run, func), calls,
+                                 chunksize=chunksize)
+        finally:
+            for _, shm, _ in blocks.values():
+                shm.close()
+                shm.unlink()
 
     def map_async(
         self,
@@ -94,18 +397,30 @@ class Pool(ProcessPoolExecutor, AbstractContextManager):
         iterable: Iterable[T],
         callback: Optional[Callable[[List[R]], None]] = None,
         timeout: Optional[float] = None,
-        chunksize: Optional[int] = None
+        chunksize: Optional[int] = None,
+        bound: str = 'compute'
     ) -> Future:
         """
         Asynchronous map: returns a Future whose result() is the list.
         Optionally execute a callback once done.
+
+        Results are collected by a background feeder thread in this
+        process, so no worker is tied up and the callback runs on the
+        feeder thread as soon as the last result arrives. ``bound`` is
+        the workload hint described in ``map``.
         """
         if chunksize is None:
-            chunksize = _calculate_chunksize(iterable, self._max_workers)
-        future = super().submit(lambda seq: list(seq), super().map(
-            func, iterable, timeout=timeout, chunksize=chunksize))
-        if callback:
-            future.add_done_callback(lambda fut: callback(fut.result()))
+            iterable = _peek_sized(iterable)
+            chunksize = _calculate_chunksize(iterable, self._max_workers, bound)
+        results = super().map(func, iterable, timeout=timeout, chunksize=chunksize)
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        threading.Thread(
+            target=_collect,
+            args=(results, future, callback),
+            name='MapAsyncFeeder',
+            daemon=True
+        ).start()
         return future
 
     def apply(
@@ -126,39 +441,425 @@ class Pool(ProcessPoolExecutor, AbstractContextManager):
         *args: Any,
         callback: Optional[Callable[[R], None]] = None,
         timeout: Optional[float] = None,
+        shared: Optional[Iterable[str]] = None,
         **kwargs: Any
     ) -> Future:
         """
         Asynchronous apply: returns a Future.
         Optionally execute a callback once done.
+
+        ``shared`` names objects registered through ``Pool(shared=...)``;
+        the worker passes them to ``func`` as keyword arguments, so only
+        the names cross the pipe.
         """
-        future = super().submit(func, *args, **kwargs)
+        if shared:
+            future = super().submit(
+                _call_with_shared, func, tuple(shared), args, kwargs)
+        else:
+            future = super().submit(func, *args, **kwargs)
         if callback:
-            future.add_done_callback(lambda fut: callback(fut.result()))
+            future.add_done_callback(functools.partial(_invoke_callback, callback))
         return future
 
+    def submit_many(
+        self,
+        func: Callable[..., R],
+        args_iter: Iterable[Tuple[Any, ...]],
+        chunksize: Optional[int] = None
+    ) -> List[Future]:
+        """
+        Submit ``func(*args)`` for every tuple in ``args_iter``, one task per chunk.
+
+        Each chunk is pickled and sent to a worker as a single task; the
+        returned list holds one Future per call, in input order, each
+        resolved with that call's own result or exception when its chunk
+        completes.
+
+        :param func: The function to call.
+        :param args_iter: Positional-argument tuples, one per call.
+        :param chunksize: Calls per task. Defaults to a size derived from the
+            number of calls and workers.
+        """
+        calls = list(args_iter)
+        if chunksize is None:
+            chunksize = _calculate_chunksize(calls, self._max_workers)
+        futures: List[Future] = []
+        for start in range(0, len(calls), chunksize):
+            chunk = calls[start:start + chunksize]
+            subs = [Future() for _ in chunk]
+            for sub in subs:
+                sub.set_running_or_notify_cancel()
+            task = super().submit(_apply_chunk, func, chunk)
+            task.add_done_callback(functools.partial(_split_chunk, subs))
+            futures.extend(subs)
+        return futures
+
     def imap_unordered(
         self,
         func: Callable[[T], R],
-        iterable: Iterable[T]
+        iterable: Iterable[T],
+        chunksize: Optional[int] = None,
+        bound: str = 'compute'
     ) -> Iterator[R]:
         """
         Iterator yielding results as soon as they are ready (unordered).
+
+        Items are grouped into chunks of ``chunksize`` and each chunk is
+        submitted as a single task, so one pickle and one pipe write are
+        paid per chunk instead of per item. At most
+        ``max_workers * _BACKLOG_FACTOR`` chunks are in flight, so the
+        iterable is consumed lazily and may be unbounded. ``bound`` is the
+        workload hint described in ``map``.
+        """
+        if chunksize is None:
+            chunksize = _calculate_chunksize(iterable, self._max_workers, bound)
+        if self._result_transport == 'manager':
+            yield from self._imap_managed(func, iterable, chunksize, ordered=False)
+            return
+        it = iter(iterable)
+        limit = self._max_workers * _BACKLOG_FACTOR
+        pending: Set[Future] = set()
+        while True:
+            while len(pending) < limit:
+                chunk = list(itertools.islice(it, chunksize))
+                if not chunk:
+                    break
+                pending.add(self.submit(_run_chunk, func, chunk))
+            if not pending:
+                return
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for fut in done:
+                yield from fut.result()
+
+    async def amap(
+        self,
+        func: Callable[[T], R],
+        iterable: Iterable[T],
+        chunksize: Optional[int] = None
+    ) -> AsyncIterator[R]:
+        """
+        Asynchronous, ordered map for asyncio code::
+
+            async for result in pool.amap(func, iterable):
+                ...
+
+        A producer task submits work into a bounded ``asyncio.Queue`` of
+        ``max_workers * _BACKLOG_FACTOR`` wrapped futures while the caller
+        awaits them in order, so no thread is parked per future.
+        """
+        if chunksize is None:
+            chunksize = _calculate_chunksize(iterable, self._max_workers)
+        it = iter(iterable)
+        tasks = iter(lambda: list(itertools.islice(it, chunksize)), [])
+        chunks = _amap_ordered(
+            functools.partial(self.submit, _run_chunk, func), tasks,
+            self._max_workers * _BACKLOG_FACTOR)
+        try:
+            async for chunk in chunks:
+                for result in chunk:
+                    yield result
+        finally:
+            await chunks.aclose()
+
+
+# Pool() parameters, used to normalise get_pool() arguments
+_POOL_SIGNATURE = inspect.signature(Pool.__init__)
+
+
+def get_pool(processes: Optional[int] = None, **kwargs: Any) -> Pool:
+    """
+    Return a process-wide Pool, creating it on first use.
+
+    Pools are keyed by ``(processes, start_method, initializer)``. Asking
+    for a cached pool with different further arguments (``initargs``,
+    ``shared``, ...) raises ``ValueError`` rather than silently returning
+    a pool configured otherwise. Leaving a ``with`` block does not shut
+    these pools down, so workers are reused across calls; they are shut
+    down at interpreter exit, or when ``shutdown()`` is called explicitly
+    (the next call then creates a new pool).
+
+    :param processes: Number of worker processes, as for ``Pool``.
+    :param kwargs: Further ``Pool`` arguments.
+    """
+    bound = _POOL_SIGNATURE.bind(None, processes, **kwargs)
+    bound.apply_defaults()
+    config = dict(bound.arguments)
+    del config['self']
+    key = (processes, config['start_method'], config['initializer'])
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is not None and not pool._shutdown_thread:
+            if not _same_config(pool._config, config):
+                raise ValueError(
+                    f"get_pool(): a pool for {key!r} already exists with "
+                    "different arguments; shut it down or use Pool() directly")
+            return pool
+        pool = Pool(processes, **kwargs)
+        pool._persistent = True
+        pool._config = config
+        _POOLS[key] = pool
+        atexit.register(pool.shutdown)
+        return pool
+
+
+def _same_config(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """
+    Compare two ``get_pool`` configurations, treating incomparable values
+    (e.g. NumPy arrays in ``shared``) as equal only when identical.
+    """
+    for name, value in a.items():
+        other = b[name]
+        if value is other:
+            continue
+        try:
+            if not bool(value == other):
+                return False
+        except Exception:
+            return False
+    return True
+
+
+def _init_shared(
+    shared: Dict[str, Any],
+    initializer: Optional[Callable[..., Any]],
+    initargs: Tuple[Any, ...]
+) -> None:
+    """
+    Worker initializer: install ``shared`` objects, then run the user initializer.
+    """
+    _WORKER_SHARED.update(shared)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class _CarriesFd(Exception):
+    """
+    Raised while pre-pickling initargs that hold a file descriptor.
+    """
+
+
+def _refuse_fd(obj: Any) -> Any:
+    """
+    Reducer standing in for multiprocessing's fd-passing ones.
+    """
+    raise _CarriesFd(type(obj).__name__)
+
+
+def _dumps_initializer(
+    initializer: Optional[Callable[..., Any]],
+    initargs: Tuple[Any, ...]
+) -> Optional[bytes]:
+    """
+    Pickle ``(initializer, initargs)`` once for every worker, or return None.
+
+    Uses multiprocessing's ForkingPickler, but refuses the reducers that
+    hand over file descriptors: their payload can only be unpickled once,
+    so such initargs must be pickled per worker as multiprocessing does.
+    """
+    buf = io.BytesIO()
+    pickler = mp_reduction.ForkingPickler(buf, pickle.HIGHEST_PROTOCOL)
+    for typ in mp_reduction.ForkingPickler._extra_reducers:
+        if typ not in _FD_FREE_TYPES:
+            pickler.dispatch_table[typ] = _refuse_fd
+    try:
+        pickler.dump((initializer, initargs))
+    except (_CarriesFd, RuntimeError, TypeError):
+        return None
+    return buf.getvalue()
+
+
+def _init_pickled(payload: bytes) -> None:
+    """
+    Worker initializer: unpickle the real initializer and its arguments, then run it.
+    """
+    initializer, initargs = pickle.loads(payload)
+    initializer(*initargs)
+
+
+def _warm_init(
+    payload: bytes,
+    name: str,
+    initializer: Optional[Callable[..., Any]],
+    initargs: Tuple[Any, ...]
+) -> None:
+    """
+    Worker initializer: run the user initializer, then build the warm state once.
+    """
+    if initializer is not None:
+        initializer(*initargs)
+    _WORKER_SHARED[name] = pickle.loads(payload)()
+
+
+def _grow_pipe(conn: Any) -> None:
+    """
+    Best-effort enlarge the pipe behind ``conn`` to ``_PIPE_SIZE`` on Linux.
+    """
+    if not sys.platform.startswith('linux'):
+        return
+    import fcntl
+    try:
+        fcntl.fcntl(conn.fileno(), fcntl.F_SETPIPE_SZ, _PIPE_SIZE)
+    except (AttributeError, OSError):
+        pass
+
+
+def _call_with_shared(
+    func: Callable[..., R],
+    names: Tuple[str, ...],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any]
+) -> R:
+    """
+    Call ``func`` with the named worker-installed objects added to ``kwargs``.
+    """
+    for name in names:
+        kwargs[name] = _WORKER_SHARED[name]
+    return func(*args, **kwargs)
+
+
+def _run_chunk(func: Callable[[T], R], chunk: List[T]) -> List[R]:
+    """
+    Apply ``func`` to every item of ``chunk`` inside a worker process.
+    """
+    return list(map(func, chunk))
+
+
+def _peek_sized(iterable: Iterable[T]) -> Iterable[T]:
+    """
+    Return `iterable` in a form whose length is known when that is cheap.
+
+    Unsized iterables shorter than ``_PEEK_LIMIT`` are materialised into a
+    list; longer ones are returned as an equivalent lazy iterator.
+    """
+    if isinstance(iterable, Sized):
+        return iterable
+    it = iter(iterable)
+    head = list(itertools.islice(it, _PEEK_LIMIT))
+    if len(head) < _PEEK_LIMIT:
+        return head
+    return itertools.chain(head, it)
+
+
+def _apply_chunk(
+    func: Callable[..., R],
+    chunk: List[Tuple[Any, ...]]
+) -> List[Tuple[bool, Any]]:
+    """
+    Call ``func(*args)`` for each entry of ``chunk`` inside a worker process.
+
+    Returns ``(True, result)`` or ``(False, exception)`` per call, so one
+    failing call does not discard the rest of its chunk.
+    """
+    outcomes: List[Tuple[bool, Any]] = []
+    for args in chunk:
+        try:
+            outcomes.append((True, func(*args)))
+        except Exception as exc:
+            outcomes.append((False, exc))
+    return outcomes
+
+
+def _split_chunk(subs: List[Future], task: Future) -> None:
+    """
+    Done-callback resolving each per-call Future from its chunk's outcomes.
+
+    The per-call Futures are already running, so a cancelled chunk fails
+    them with ``CancelledError`` rather than leaving them pending.
+    """
+    if task.cancelled():
+        for sub in subs:
+            sub.set_exception(concurrent.futures.CancelledError())
+        return
+    exc = task.exception()
+    if exc is not None:
+        for sub in subs:
+            sub.set_exception(exc)
+        return
+    for sub, (ok, value) in zip(subs, task.result()):
+        if ok:
+            sub.set_result(value)
+        else:
+            sub.set_exception(value)
+
+
+class _SharedArray:
+    """
+    Picklable handle to an ndarray stored in a ``SharedMemory`` block.
+    """
+    __slots__ = ('name', 'shape', 'dtype')
+
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: Any) -> None:
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __getstate__(self) -> Tuple[str, Tuple[int, ...], Any]:
+        return self.name, self.shape, self.dtype
+
+    def __setstate__(self, state: Tuple[str, Tuple[int, ...], Any]) -> None:
+        self.name, self.shape, self.dtype = state
+
+    def attach(self) -> Any:
         """
-        futures = [self.submit(func, item) for item in iterable]
-        for fut in concurrent.futures.as_completed(futures):
-            yield fut.result()
+        Map the block and return an ndarray over it.
+
+        The mapping is closed once the array and every view of it have been
+        collected; closing it earlier would leave views dangling.
+        """
+        import numpy as np
+        shm = SharedMemory(name=self.name)
+        array = np.ndarray(self.shape, self.dtype, buffer=shm.buf)
+        weakref.finalize(array, shm.close)
+        return array
+
+
+def _reattach_and_run(func: Callable[..., R], args: Tuple[Any, ...]) -> R:
+    """
+    Worker side of map_shared: call ``func`` with shared arrays attached.
+    """
+    return func(*[arg.attach() if isinstance(arg, _SharedArray) else arg
+                  for arg in args])
+
+
+def _run_chunk_to_queue(
+    func: Callable[..., R],
+    chunk: List[Any],
+    results: Any,
+    idx: int,
+    star: bool
+) -> None:
+    """
+    Apply ``func`` to ``chunk`` and put ``(idx, results)`` on a manager queue.
+    """
+    if star:
+        values = [func(*args) for args in chunk]
+    else:
+        values = list(map(func, chunk))
+    results.put((idx, values))
 
 
 def _calculate_chunksize(
     iterable: Iterable,
-    workers: int
+    workers: int,
+    bound: str = 'compute'
 ) -> int:
     """
     Determine a sensible chunksize for map operations.
+
+    :param bound: Workload hint. ``'compute'`` aims for ~4 chunks per worker
+        to balance load; ``'memory'`` uses one chunk per worker, since
+        finer chunks only add scheduling contention to memory-bound work.
+
+    Iterables of unknown length get a fixed size between 4 and 64 rather
+    than 1, so they still amortise one pickle and pipe write over a chunk.
     """
-    if isinstance(iterable, Sized):
-        length = len(iterable)
-        chunksize, extra = divmod(length, workers * 4)
-        return chunksize + 1 if extra else max(1, chunksize)
-    return 1
+    if bound not in ('compute', 'memory'):
+        raise ValueError(f"bound must be 'compute' or 'memory', not {bound!r}")
+    if not isinstance(iterable, Sized):
+        return max(4, min(64, _PEEK_LIMIT // (workers << 2)))
+    n = len(iterable)
+    if bound == 'memory':
+        return max(1, n // workers)
+    q, r = divmod(n, workers << 2)
+    return max(1, q + (r > 0))
@@ -4,9 +4,13 @@ Thread Pool implementation for HyperProcess.
 Provides a high-level, context-managed API for threading
 using ThreadPoolExecutor under the hood.
 """
+import asyncio
 import concurrent.futures
+import functools
+import itertools
+import threading
 from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, List, Tuple
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, TypeVar, List, Set, Tuple
 from contextlib import AbstractContextManager
 
 # Define type variables
@@ -14,6 +18,9 @@ _T = TypeVar("_T")
 T = TypeVar("T")
 R = TypeVar("R")
 
+# Outstanding futures allowed per worker in imap_unordered
+_BACKLOG_FACTOR = 2
+
 
 class ThreadPool(ThreadPoolExecutor, AbstractContextManager):
     """
@@ -51,11 +58,23 @@ class ThreadPool(ThreadPoolExecutor, AbstractContextManager):
         timeout: float | None = None,
         chunksize: int = 1
     ) -> Iterator[_T]:
-        """Match Executor.map signature exactly."""
+        """Match Executor.map signature exactly; results are yielded lazily, in order."""
         return super().map(fn, *iterables,
                            timeout=timeout,
                            chunksize=chunksize)
 
+    def map_list(
+        self,
+        fn: Callable[..., _T],
+        *iterables: Iterable[Any],
+        timeout: float | None = None,
+        chunksize: int = 1
+    ) -> List[_T]:
+        """
+        Like map(), but block until every result is ready and return them as a list.
+        """
+        return list(self.map(fn, *iterables, timeout=timeout, chunksize=chunksize))
+
     def map_async(
         self,
         func: Callable[[T], R],
@@ -66,11 +85,20 @@ class ThreadPool(ThreadPoolExecutor, AbstractContextManager):
         """
         Asynchronous map: returns a Future whose result() is the list.
         Optionally execute a callback once done.
+
+        Results are collected by a background feeder thread in this
+        process, so no worker is tied up and the callback runs on the
+        feeder thread as soon as the last result arrives.
         """
-        future = super().submit(lambda seq: list(
-            seq), super().map(func, iterable, timeout=timeout))
-        if callback:
-            future.add_done_callback(lambda fut: callback(fut.result()))
+        results = super().map(func, iterable, timeout=timeout)
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        threading.Thread(
+            target=_collect,
+            args=(results, future, callback),
+            name='MapAsyncFeeder',
+            daemon=True
+        ).start()
         return future
 
     def apply(
@@ -99,7 +127,7 @@ class ThreadPool(ThreadPoolExecutor, AbstractContextManager):
         """
         future = super().submit(func, *args, **kwargs)
         if callback:
-            future.add_done_callback(lambda fut: callback(fut.result()))
+            future.add_done_callback(functools.partial(_invoke_callback, callback))
         return future
 
     def imap_unordered(
@@ -109,7 +137,115 @@ class ThreadPool(ThreadPoolExecutor, AbstractContextManager):
     ) -> Iterator[R]:
         """
         Iterator yielding results as soon as they are ready (unordered).
+
+        Items are submitted one by one (threads have no pickling cost), but
+        at most ``max_workers * _BACKLOG_FACTOR`` futures are outstanding at
+        any time, so the iterable is consumed lazily and may be unbounded.
+        """
+        it = iter(iterable)
+        limit = self._max_workers * _BACKLOG_FACTOR
+        pending: Set[Future] = set()
+        while True:
+            for item in itertools.islice(it, limit - len(pending)):
+                pending.add(self.submit(func, item))
+            if not pending:
+                return
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+
+    async def amap(
+        self,
+        func: Callable[[T], R],
+        iterable: Iterable[T]
+    ) -> AsyncIterator[R]:
+        """
+        Asynchronous, ordered map for asyncio code::
+
+            async for result in pool.amap(func, iterable):
+                ...
+
+        A producer task submits work into a bounded ``asyncio.Queue`` of
+        ``max_workers * _BACKLOG_FACTOR`` wrapped futures while the caller
+        awaits them in order, so no thread is parked per future.
         """
-        futures = [self.submit(func, item) for item in iterable]
-        for fut in concurrent.futures.as_completed(futures):
-            yield fut.result()
+        results = _amap_ordered(
+            functools.partial(self.submit, func), iterable,
+            self._max_workers * _BACKLOG_FACTOR)
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+
+
+def _invoke_callback(callback: Callable[[Any], None], fut: Future) -> None:
+    """
+    Done-callback passing a future's result to ``callback``.
+
+    Done-callbacks only run once the future is final, so a successful
+    result is read directly instead of through ``result()`` and its lock.
+    """
+    if fut._state == concurrent.futures._base.FINISHED and fut._exception is None:
+        callback(fut._result)
+    else:
+        callback(fut.result())
+
+
+def _collect(
+    results: Iterator[R],
+    future: Future,
+    callback: Optional[Callable[[List[R]], None]]
+) -> None:
+    """
+    Collect ``results`` on a feeder thread, resolve ``future`` and run ``callback``.
+    """
+    collected: List[R] = []
+    try:
+        for result in results:
+            collected.append(result)
+    except BaseException as exc:
+        future.set_exception(exc)
+        return
+    future.set_result(collected)
+    if callback:
+        callback(collected)
+
+
+async def _amap_ordered(
+    submit: Callable[[Any], Future],
+    tasks: Iterable[Any],
+    backlog: int
+) -> AsyncIterator[Any]:
+    """
+    Submit ``tasks`` and yield their results in order, for ``amap``.
+
+    A producer task submits work into a bounded ``asyncio.Queue`` of
+    ``backlog`` wrapped futures while the caller awaits them in order.
+    """
+    pending: "asyncio.Queue[Optional[asyncio.Future]]" = asyncio.Queue(
+        maxsize=backlog)
+
+    async def produce() -> None:
+        try:
+            for task in tasks:
+                await pending.put(asyncio.wrap_future(submit(task)))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            await pending.put(None)
+            raise
+        await pending.put(None)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            fut = await pending.get()
+            if fut is None:
+                break
+            yield await fut
+        await producer
+    finally:
+        if not producer.done():
+            producer.cancel()
@@ -7,157 +7,442 @@ a circular import conflict with Python's built-in queue module.
 
 from __future__ import annotations
 import sys
-import threading
-import collections
+import struct
 import time
 import weakref
 import logging
 import queue as std_queue  # Standard library queue for Empty and Full exceptions
-from typing import Any, Optional, Deque, TypeVar, Callable, Generic
-from dataclasses import dataclass
-from multiprocessing import (
-    Pipe,
-    get_context,
-)
-from multiprocessing.util import Finalize, is_exiting, register_after_fork
-from threading import Condition
-from multiprocessing.context import BaseContext
+from typing import Any, Iterable, Optional, TypeVar, Generic
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext, assert_spawning
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import SEM_VALUE_MAX
+from hyperprocess.core.connection import Pipe
+from hyperprocess.core.forking import dumps, loads
 
 
 T = TypeVar('T')
-_sentinel = object()
 
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
 
-# Obtain the default context and use it to create synchronization primitives
-_ctx = get_context()
+DEFAULT_RING_BYTES = 4 * 1024 * 1024
 
+# Slots of the shared counter array
+_HEAD, _TAIL, _PUTS, _GETS, _WAITING = range(5)
+_LENGTH = struct.Struct('Q')
+# Record header: pickle length and number of out-of-band buffers that follow it
+_HEADER = struct.Struct('QQ')
+# Set in a record's pickle-length field when the payload lives in its own block
+_SPILL = 1 << 63
+# Upper bound on a single wait for ring space; bounds the cost of a missed wake-up
+_SPACE_POLL = 0.05
+# Ring bytes of a spill record for an item without out-of-band buffers
+# (block names are well under 32 bytes)
+_STUB_BYTES = _HEADER.size + _LENGTH.size + 32
 
-@dataclass
-class QueueState:
-    maxsize: int
-    buffer: Deque
-    thread: Optional[threading.Thread]
-    jointhread: Optional[Finalize]
-    close: Optional[Finalize]
-    closed: bool = False
-    joincancelled: bool = False
-    size: int = 0  # Manual counter for queue size
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """
+    Seconds left until `deadline`, or None for no deadline.
+    """
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def _payload(segments: list) -> list:
+    """
+    The pickle and buffers of an in-ring record's segments, without the header.
+    """
+    return [segments[0][_HEADER.size:]] + segments[2:]
+
+
+def _unspill(name: str, sizes: tuple) -> tuple:
+    """
+    Copy a spilled record's pickle and buffers out of its block, then remove it.
+    """
+    shm = SharedMemory(name=name)
+    try:
+        parts = []
+        pos = 0
+        for nbytes in sizes:
+            parts.append(bytearray(shm.buf[pos:pos + nbytes]))
+            pos += nbytes
+    finally:
+        shm.close()
+        shm.unlink()
+    return parts[0], parts[1:]
 
 
 class Queue(Generic[T]):
     """
-    A process-safe FIFO queue with enhanced performance.
+    A process-safe FIFO queue backed by a shared-memory ring buffer.
+
+    Each item is pickled (protocol 5) straight into a length-prefixed record
+    of a ``SharedMemory`` ring, with out-of-band buffers such as NumPy array
+    data copied in directly rather than through the pickle stream; producers advance ``tail`` under ``_wlock`` and
+    consumers advance ``head`` under ``_rlock``. There is no pipe and no
+    feeder thread: a put is one pickle plus one memcpy. Producers that find
+    the ring full release ``_wlock`` and sleep on an Event that consumers
+    only set when a producer has flagged itself as waiting. Items too large
+    for the ring travel in a ``SharedMemory`` block of their own; so do
+    items put on a full unbounded queue, which only waits once the ring
+    cannot hold even that block's name.
     """
 
-    def __init__(self, maxsize: int = 0, ctx: Optional[BaseContext] = None):
+    def __init__(
+        self,
+        maxsize: int = 0,
+        ctx: Optional[BaseContext] = None,
+        ring_bytes: int = DEFAULT_RING_BYTES
+    ):
         self._ctx = ctx or get_context('spawn')
         self._maxsize = maxsize
-        self._lock = self._ctx.Lock()  # Use multiprocessing Lock
-        self._data: collections.deque[T] = collections.deque()
-        # Use a smaller value for semaphore initialization
-        self._sem = self._ctx.Semaphore(
-            min(maxsize, 32767) if maxsize > 0 else 32767)
+        # Only bounded queues pay for a cross-process semaphore per put/get
+        self._sem = (self._ctx.Semaphore(min(maxsize, SEM_VALUE_MAX))
+                     if maxsize > 0 else None)
 
         if maxsize <= 0:
             maxsize = 2 ** 31 - 1  # Use a very large number for unlimited size
 
-        self._state = QueueState(
-            maxsize=maxsize,
-            buffer=collections.deque(),
-            thread=None,
-            jointhread=None,
-            close=None
-        )
-
-        self._reader, self._writer = Pipe(duplex=False)
-        self._rlock = _ctx.Lock()
-        self._wlock = None if sys.platform == 'win32' else _ctx.Lock()
-        self._notempty = threading.Condition(threading.Lock())
-        self._after_fork()
-
-        if sys.platform != 'win32':
-            register_after_fork(self, Queue._after_fork)
-        logging.debug("Queue initialized with maxsize %s", maxsize)
-
-    def _after_fork(self) -> None:
-        """
-        Initialize queue state after a fork.
-        """
-        logging.debug("Queue._after_fork() called")
-        self._state.buffer.clear()
-        self._state.thread = None
-        self._send = self._writer.send
-        self._recv = self._reader.recv
-        self._poll = self._reader.poll
+        self._shm = SharedMemory(create=True, size=ring_bytes)
+        self._capacity = ring_bytes
+        self._counters = self._ctx.RawArray('Q', 5)
+        self._items = self._ctx.Semaphore(0)
+        self._not_full = self._ctx.Event()
+        self._rlock = self._ctx.Lock()
+        self._wlock = self._ctx.Lock()
+        self._setup(maxsize)
+        # Only the creating process removes the segment's name.
+        weakref.finalize(self, self._shm.unlink)
+        logger.debug("Queue initialized with maxsize %s", maxsize)
+
+    def _setup(self, maxsize: int) -> None:
+        self._full_size = maxsize
+        self._closed = False
+        self._buf = self._shm.buf
+
+    def __getstate__(self) -> tuple:
+        assert_spawning(self)
+        return (self._maxsize, self._full_size, self._sem, self._shm.name,
+                self._capacity, self._counters, self._items, self._not_full,
+                self._rlock, self._wlock)
+
+    def __setstate__(self, state: tuple) -> None:
+        (self._maxsize, full_size, self._sem, name, self._capacity,
+         self._counters, self._items, self._not_full,
+         self._rlock, self._wlock) = state
+        self._shm = SharedMemory(name=name)
+        self._setup(full_size)
+
+    def _write(self, pos: int, data: memoryview) -> None:
+        """
+        Copy `data` into the ring at logical offset `pos`, splitting at the wrap.
+        """
+        start = pos % self._capacity
+        first = min(len(data), self._capacity - start)
+        self._buf[start:start + first] = data[:first]
+        if first < len(data):
+            self._buf[:len(data) - first] = data[first:]
+
+    def _read(self, pos: int, size: int) -> bytearray:
+        """
+        Copy `size` bytes out of the ring starting at logical offset `pos`.
+        """
+        start = pos % self._capacity
+        first = min(size, self._capacity - start)
+        out = bytearray(size)
+        out[:first] = self._buf[start:start + first]
+        if first < size:
+            out[first:] = self._buf[:size - first]
+        return out
+
+    def _has_space(self, needed: int) -> bool:
+        counters = self._counters
+        return self._capacity - (counters[_TAIL] - counters[_HEAD]) >= needed
+
+    def _make_room(self, records: list, i: int) -> bool:
+        """
+        Return whether `records[i]` fits in the ring now (caller holds `_wlock`).
+
+        On an unbounded queue a record that does not fit is spilled first,
+        so only its name record needs to.
+        """
+        counters = self._counters
+        free = self._capacity - (counters[_TAIL] - counters[_HEAD])
+        record = records[i]
+        if record[2] <= free:
+            return True
+        if self._sem is not None or record[1] is not None:
+            return False
+        # Unbounded: move the payload out of the ring instead of waiting
+        records[i] = record = self._spill(_payload(record[0]))
+        return record[2] <= free
+
+    def _write_record(self, record: tuple) -> None:
+        """
+        Append one record at the ring's tail (caller holds `_wlock`).
+        """
+        counters = self._counters
+        pos = counters[_TAIL]
+        for seg in record[0]:
+            self._write(pos, seg)
+            pos += seg.nbytes
+        counters[_TAIL] = pos
+        counters[_PUTS] += 1
+        self._items.release()
+
+    def _write_available(
+        self,
+        records: list,
+        i: int,
+        block: bool,
+        deadline: Optional[float]
+    ) -> int:
+        """
+        Write `records[i]`, plus any following records that fit right away.
+
+        The caller holds a maxsize slot for `records[i]`. `_wlock` is only
+        held while checking for space and copying; a producer waiting for
+        space drops it, so other producers' non-blocking and timed puts are
+        not held up behind it. Raises Full only before `records[i]` is
+        written; returns the index of the first record not yet written.
+        """
+        sem = self._sem
+        while True:
+            if not self._wlock.acquire(block, _remaining(deadline)):
+                raise std_queue.Full
+            try:
+                fits = self._make_room(records, i)
+                if not fits:
+                    if not block:
+                        raise std_queue.Full
+                    self._counters[_WAITING] = 1
+                    self._not_full.clear()
+                    # A consumer may have made room before the flag was set
+                    fits = self._make_room(records, i)
+                if fits:
+                    self._write_record(records[i])
+                    i += 1
+                    # Opportunistically write the rest of a batch in this hold
+                    while i < len(records):
+                        if sem is not None and not sem.acquire(False):
+                            break
+                        if not self._make_room(records, i):
+                            if sem is not None:
+                                sem.release()
+                            break
+                        self._write_record(records[i])
+                        i += 1
+                    return i
+            finally:
+                self._wlock.release()
+            wait = _SPACE_POLL
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    raise std_queue.Full
+            self._not_full.wait(wait)
+
+    def _encode(self, obj: Any) -> tuple:
+        """
+        Pickle `obj` into the segments of one ring record.
+
+        Returns ``(segments, spill, nbytes)``. The pickle is written after
+        room for the record header, which is filled in place, so an item
+        without out-of-band buffers is a single segment. Otherwise the
+        buffer sizes and then the buffers follow the pickle. Records that
+        would not fit in the ring are spilled (see `_spill`).
+        """
+        buffers: list = []
+        data = dumps(obj, buffers, reserve=_HEADER.size)
+        _HEADER.pack_into(data, 0, data.nbytes - _HEADER.size, len(buffers))
+        if not buffers:
+            segments = [data]
+            nbytes = data.nbytes
+        else:
+            raws = [buf.raw() for buf in buffers]
+            sizes = memoryview(b''.join(_LENGTH.pack(raw.nbytes) for raw in raws))
+            segments = [data, sizes] + raws
+            nbytes = sum(seg.nbytes for seg in segments)
+        if nbytes <= self._capacity:
+            return segments, None, nbytes
+        return self._spill(_payload(segments))
+
+    def _spill(self, parts: list) -> tuple:
+        """
+        Move a pickle and its buffers into a ``SharedMemory`` block of their own.
+
+        Returns ``(segments, spill, nbytes)`` for a ring record that only
+        carries the block's name; the consumer unlinks the block after
+        reading it.
+        """
+        sizes = [part.nbytes for part in parts]
+        spill = SharedMemory(create=True, size=max(1, sum(sizes)))
+        pos = 0
+        for part in parts:
+            spill.buf[pos:pos + part.nbytes] = part
+            pos += part.nbytes
+        spill.close()
+        name = spill.name.encode()
+        header = _HEADER.pack(_SPILL | len(name), len(parts) - 1) + b''.join(
+            _LENGTH.pack(size) for size in sizes)
+        if len(header) + len(name) > self._capacity:
+            spill.unlink()
+            raise ValueError(f"Queue ring of {self._capacity} bytes is too small")
+        return [memoryview(header), memoryview(name)], spill, len(header) + len(name)
+
+    def _encode_all(self, objs: Iterable[Any]) -> list:
+        """
+        Encode every item of `objs`, removing spill blocks if one fails.
+        """
+        records: list = []
+        try:
+            for obj in objs:
+                records.append(self._encode(obj))
+        except BaseException:
+            for _, spill, _ in records:
+                if spill is not None:
+                    spill.unlink()
+            raise
+        return records
+
+    def _put_records(
+        self,
+        records: list,
+        block: bool,
+        timeout: Optional[float]
+    ) -> int:
+        """
+        Write encoded records into the ring, in order.
+
+        Returns how many were written; fewer than ``len(records)`` means the
+        queue was full. The records already written stay queued and the
+        spill blocks of the rest are removed. The maxsize semaphore is
+        waited on without holding `_wlock`.
+        """
+        deadline = (time.monotonic() + timeout
+                    if block and timeout is not None else None)
+        sem = self._sem
+        i = 0
+        try:
+            while i < len(records):
+                if sem is not None and not sem.acquire(block, _remaining(deadline)):
+                    break
+                try:
+                    i = self._write_available(records, i, block, deadline)
+                except BaseException as exc:
+                    if sem is not None:
+                        sem.release()
+                    if isinstance(exc, std_queue.Full):
+                        break
+                    raise
+        finally:
+            for _, spill, _ in records[i:]:
+                if spill is not None:
+                    spill.unlink()
+        return i
 
     def put(self, obj: T, block: bool = True, timeout: Optional[float] = None) -> None:
         """
         Put an item into the queue.
         """
-        if self._state.closed:
+        if self._closed:
             raise ValueError("Queue is closed")
-
-        if not self._sem.acquire(block, timeout):
+        if not self._put_records([self._encode(obj)], block, timeout):
             raise std_queue.Full
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Item put into queue. New size: %d", self.qsize())
+
+    def put_many(
+        self,
+        objs: Iterable[T],
+        block: bool = True,
+        timeout: Optional[float] = None
+    ) -> None:
+        """
+        Put several items, in order.
 
-        with self._notempty:
-            if self._state.thread is None:
-                self._start_thread()
-            self._state.buffer.append(obj)
-            self._state.size += 1
-            logging.debug("Item put into queue. New size: %d",
-                          self._state.size)
-            self._notempty.notify()
+        Consecutive items are written under one hold of the write lock as
+        long as they fit. Items stay individually gettable. If the queue fills up part way
+        through, the items already written stay queued and Full is raised.
+        """
+        if self._closed:
+            raise ValueError("Queue is closed")
+        records = self._encode_all(objs)
+        if self._put_records(records, block, timeout) < len(records):
+            raise std_queue.Full
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Items put into queue. New size: %d", self.qsize())
 
     def get(self, block: bool = True, timeout: Optional[float] = None) -> T:
         """
         Remove and return an item from the queue.
         """
-        if block and timeout is None:
-            with self._rlock:
-                item = self._recv()
-                self._sem.release()
-                self._state.size -= 1
-                logging.debug(
-                    "Item retrieved from queue. New size: %d", self._state.size)
-                return item
-
-        deadline = time.monotonic() + timeout if timeout else None
-
-        if not self._rlock.acquire(block, timeout):
+        if not self._items.acquire(block, timeout):
             raise std_queue.Empty
 
-        try:
-            wait_time = deadline - time.monotonic() if deadline else 0.0
-            if not self._poll(wait_time):
-                raise std_queue.Empty
-            item = self._recv()
+        with self._rlock:
+            counters = self._counters
+            pos = counters[_HEAD]
+            start = pos % self._capacity
+            if start + _HEADER.size <= self._capacity:
+                size, nbufs = _HEADER.unpack_from(self._buf, start)
+            else:
+                size, nbufs = _HEADER.unpack(self._read(pos, _HEADER.size))
+            pos += _HEADER.size
+            name = None
+            buffers = None
+            if size & _SPILL:
+                # A spilled record lists the pickle's own length up front too
+                nsizes = nbufs + 1
+                sizes = struct.unpack(f'{nsizes}Q', self._read(pos, nsizes * _LENGTH.size))
+                pos += nsizes * _LENGTH.size
+                name = self._read(pos, size ^ _SPILL).decode()
+                pos += size ^ _SPILL
+            else:
+                data = self._read(pos, size)
+                pos += size
+                if nbufs:
+                    sizes = struct.unpack(f'{nbufs}Q', self._read(pos, nbufs * _LENGTH.size))
+                    pos += nbufs * _LENGTH.size
+                    buffers = []
+                    for nbytes in sizes:
+                        buffers.append(self._read(pos, nbytes))
+                        pos += nbytes
+            counters[_HEAD] = pos
+            counters[_GETS] += 1
+            if counters[_WAITING]:
+                counters[_WAITING] = 0
+                self._not_full.set()
+        if self._sem is not None:
             self._sem.release()
-            self._state.size -= 1
-            logging.debug(
-                "Item retrieved (with timeout) from queue. New size: %d", self._state.size)
-            return item
-        finally:
-            self._rlock.release()
+        if name is not None:
+            data, buffers = _unspill(name, sizes)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Item retrieved from queue. New size: %d", self.qsize())
+        return loads(data, buffers=buffers)
 
     def qsize(self) -> int:
         """
         Return an approximate size of the queue.
         """
-        return self._state.size
+        return self._counters[_PUTS] - self._counters[_GETS]
 
     def empty(self) -> bool:
         """
         Return True if the queue is empty.
         """
-        return self._state.size == 0
+        return self.qsize() == 0
 
     def full(self) -> bool:
         """
         Return True if the queue is full.
+
+        Besides reaching maxsize, a queue is full when its ring has no room
+        left for even a spilled item's record.
         """
-        return self._state.size >= self._state.maxsize
+        return self.qsize() >= self._full_size or not self._has_space(_STUB_BYTES)
 
     def get_nowait(self) -> T:
         """
@@ -173,170 +458,110 @@ class Queue(Generic[T]):
 
     def close(self) -> None:
         """
-        Close the queue.
+        Close the queue; no more items can be put through this handle.
         """
-        self._state.closed = True
-        self._reader.close()
-        if self._state.close:
-            self._state.close()
-        logging.debug("Queue closed.")
+        self._closed = True
+        logger.debug("Queue closed.")
 
     def join_thread(self) -> None:
         """
-        Wait for the background thread to exit.
+        Kept for multiprocessing.Queue compatibility; there is no feeder thread.
         """
-        if not self._state.closed:
+        if not self._closed:
             raise ValueError("Queue must be closed first")
-        if self._state.jointhread:
-            self._state.jointhread()
-        logging.debug("Join thread completed.")
 
     def cancel_join_thread(self) -> None:
         """
-        Cancel joining the background thread upon close.
-        """
-        self._state.joincancelled = True
-        if self._state.jointhread:
-            self._state.jointhread.cancel()
-        logging.debug("Join thread cancelled.")
-
-    def _start_thread(self) -> None:
-        """
-        Start the background thread that feeds items from the buffer to the pipe.
-        """
-        logging.debug("Starting queue feeder thread.")
-        self._state.buffer.clear()
-        self._state.thread = threading.Thread(
-            target=self._feed,
-            args=(
-                self._state.buffer,
-                self._notempty,
-                self._send,
-                self._wlock,
-                self._writer.close
-            ),
-            name='QueueFeederThread',
-            daemon=True
-        )
-        self._state.thread.start()
-        logging.debug("Queue feeder thread started.")
-
-        self._state.jointhread = Finalize(
-            self._state.thread,
-            Queue._finalize_join,
-            args=(weakref.ref(self._state.thread),),
-            exitpriority=-5
-        )
-        self._state.close = Finalize(
-            self,
-            Queue._finalize_close,
-            args=(self._state.buffer, self._notempty),
-            exitpriority=10
-        )
-
-    @staticmethod
-    def _finalize_close(buffer: Deque, notempty: threading.Condition) -> None:
-        """
-        Clean up the queue when the process exits.
-        """
-        logging.debug("Finalizing queue close.")
-        with notempty:
-            buffer.append(_sentinel)
-            notempty.notify()
-
-    @staticmethod
-    def _finalize_join(twr: weakref.ReferenceType[threading.Thread]) -> None:
-        """
-        Finalize the background thread join.
-        """
-        logging.debug("Finalizing join thread.")
-        thread = twr()
-        if thread is not None:
-            thread.join()
-        logging.debug("Queue feeder thread joined.")
-
-    @staticmethod
-    def _feed(
-        buffer: Deque,
-        notempty: threading.Condition,
-        send: Callable,
-        writelock: Optional[Any],
-        close: Callable
-    ) -> None:
-        """
-        Continuously feed items from the buffer to the pipe.
+        Kept for multiprocessing.Queue compatibility; there is no feeder thread.
         """
-        logging.debug("Feeder thread started.")
-        while True:
-            with notempty:
-                if not buffer:
-                    notempty.wait()
-                try:
-                    while True:
-                        obj = buffer.popleft()
-                        if obj is _sentinel:
-                            logging.debug(
-                                "Feeder thread received sentinel, exiting.")
-                            close()
-                            return
-                        if writelock:
-                            with writelock:
-                                send(obj)
-                        else:
-                            send(obj)
-                except IndexError:
-                    continue
-                except Exception as e:
-                    if not is_exiting():
-                        import traceback
-                        traceback.print_exc()
-                    logging.error("Error in feeder thread: %s", e)
-                    return
 
 
 class JoinableQueue(Queue):
     """
     A queue with task tracking to support join operations.
+
+    The unfinished-task count is a shared ``Value``; ``join`` waits on an
+    Event that is set whenever the count drops to zero, so task_done and
+    join work across processes.
     """
 
-    def __init__(self, maxsize: int = 0):
-        super().__init__(maxsize)
-        # Use an explicit counter for unfinished tasks instead of a Semaphore
-        self._unfinished_tasks_count = 0
-        self._cond = Condition()
+    def __init__(self, maxsize: int = 0, ctx: Optional[BaseContext] = None):
+        super().__init__(maxsize, ctx)
+        self._unfinished = self._ctx.Value('q', 0)
+        self._done = self._ctx.Event()
+        self._done.set()
+
+    def __getstate__(self) -> tuple:
+        return super().__getstate__() + (self._unfinished, self._done)
+
+    def __setstate__(self, state: tuple) -> None:
+        super().__setstate__(state[:-2])
+        self._unfinished, self._done = state[-2:]
+
+    def _add_unfinished(self, n: int) -> None:
+        """
+        Adjust the unfinished-task count by `n`, keeping `_done` in step.
+        """
+        with self._unfinished.get_lock():
+            self._unfinished.value += n
+            if self._unfinished.value == 0:
+                self._done.set()
+            elif n > 0 and self._unfinished.value == n:
+                self._done.clear()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unfinished tasks count: %d", self._unfinished.value)
 
     def put(self, item: T, block: bool = True, timeout: Optional[float] = None) -> None:
-        super().put(item, block, timeout)
-        with self._cond:
-            self._unfinished_tasks_count += 1
-            logging.debug("Task added. Unfinished tasks count: %d",
-                          self._unfinished_tasks_count)
+        self.put_many((item,), block, timeout)
+
+    def put_many(
+        self,
+        objs: Iterable[T],
+        block: bool = True,
+        timeout: Optional[float] = None
+    ) -> None:
+        if self._closed:
+            raise ValueError("Queue is closed")
+        records = self._encode_all(objs)
+        # Count the tasks before they become visible, so a fast consumer's
+        # task_done() can never run ahead of the increment.
+        self._add_unfinished(len(records))
+        written = 0
+        try:
+            written = self._put_records(records, block, timeout)
+        finally:
+            if written < len(records):
+                self._add_unfinished(written - len(records))
+        if written < len(records):
+            raise std_queue.Full
 
     def task_done(self) -> None:
         """
         Indicate that a previously enqueued task is complete.
         """
-        with self._cond:
-            if self._unfinished_tasks_count <= 0:
+        with self._unfinished.get_lock():
+            if self._unfinished.value <= 0:
                 raise ValueError("task_done() called too many times")
-            self._unfinished_tasks_count -= 1
-            if self._unfinished_tasks_count == 0:
-                self._cond.notify_all()
-                logging.debug("All tasks finished; notified all.")
+            self._unfinished.value -= 1
+            if self._unfinished.value == 0:
+                self._done.set()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("All tasks finished; notified all.")
 
     def join(self) -> None:
         """
         Block until all items in the queue have been processed.
         """
-        with self._cond:
-            while self._unfinished_tasks_count > 0:
-                self._cond.wait()
-            logging.debug("Join complete; all tasks have been processed.")
+        self._done.wait()
+        logger.debug("Join complete; all tasks have been processed.")
 
 
 class SimpleQueue:
     """
-    A simplified queue implementation using a locked pipe.
+    A simplified queue implementation using a locked one-way pipe.
+
+    The pipe comes from ``hyperprocess.core.connection.Pipe``, which is a
+    socketpair with enlarged buffers on POSIX.
     """
 
     def __init__(self, *, ctx: Optional[BaseContext] = None):
@@ -346,7 +571,7 @@ class SimpleQueue:
         self._rlock = ctx.Lock()
         self._wlock = None if sys.platform == 'win32' else ctx.Lock()
         self._make_methods()
-        logging.debug("SimpleQueue initialized.")
+        logger.debug("SimpleQueue initialized.")
 
     def empty(self) -> bool:
         """
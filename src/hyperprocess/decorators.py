@@ -8,7 +8,11 @@ traceable parallel execution.
 Author: Amir Hossein Partovi
 """
 
+import atexit
+import collections
 import functools
+import threading
+from concurrent.futures import ALL_COMPLETED, wait
 import time
 import logging
 from hyperprocess.pool.threadpool import ThreadPoolExecutorPlus
@@ -39,30 +43,121 @@ def profile_execution(log_to_stream=False):
     return decorator
 
 
-def parallelize_plus(mode="thread", max_workers=None, return_results=True):
+# Auxiliary data installed once per worker process by _set_aux
+_WORKER_AUX = None
+
+
+def _make_pool(mode="thread", max_workers=None, maxtasksperchild=None,
+               initializer=None, initargs=()):
+    """
+    Create an executor for ``mode`` and register its shutdown at exit.
+    """
+    if mode == "thread":
+        pool = ThreadPoolExecutorPlus(
+            max_workers=max_workers, initializer=initializer, initargs=initargs)
+    elif maxtasksperchild is not None:
+        pool = ProcessPoolExecutorPlus(
+            max_workers=max_workers, initializer=initializer, initargs=initargs,
+            max_tasks_per_child=maxtasksperchild)
+    else:
+        pool = ProcessPoolExecutorPlus(
+            max_workers=max_workers, initializer=initializer, initargs=initargs)
+    atexit.register(pool.shutdown, wait=True)
+    return pool
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pool(mode="thread", max_workers=None, maxtasksperchild=None):
+    """
+    Return a persistent executor for (mode, max_workers, maxtasksperchild).
+
+    Executors are created lazily on first use, reused by every decorated
+    call with the same settings, and shut down at interpreter exit.
+    """
+    return _make_pool(mode, max_workers, maxtasksperchild)
+
+
+def _set_aux(aux):
+    """
+    Worker initializer: store ``aux`` for the lifetime of the worker.
+    """
+    global _WORKER_AUX
+    _WORKER_AUX = aux
+
+
+def _apply(func, args, kwargs, item):
+    """
+    Call ``func(item, *args, **kwargs)``; module-level so it stays picklable.
+    """
+    return func(item, *args, **kwargs)
+
+
+def _run_with_aux(func, args, kwargs, item):
+    """
+    Call ``func(item, aux, *args, **kwargs)`` with the worker's installed aux.
+    """
+    return func(item, _WORKER_AUX, *args, **kwargs)
+
+
+def parallelize_plus(mode="thread", max_workers=None, return_results=True,
+                     maxtasksperchild=None, aux=None):
     """
     Use HyperProcess-enhanced executors for parallel execution over iterable data.
+
+    The executor is shared across calls (see ``_get_pool``), so worker
+    startup is paid once per process rather than once per call.
+
+    When ``aux`` is given, it is passed to the function as the second
+    positional argument, ``func(item, aux, *args, **kwargs)``. In process
+    mode it is shipped once per worker through the pool initializer
+    instead of being pickled with every item; such a decorator owns a
+    dedicated pool. Extra ``*args``/``**kwargs`` given to the decorated
+    call are pickled once per chunk, not once per item.
     
     Args:
         mode (str): 'thread' or 'process'
         max_workers (int): Number of workers.
         return_results (bool): If True, results will be collected and returned.
+            Either way the call waits for every item and re-raises the
+            first error.
+        maxtasksperchild (int): Recycle process workers after this many tasks.
+        aux (Any): Auxiliary data shared by every call of the function.
     
     Usage:
         @parallelize_plus(mode="process")
         def work(x): ...
     """
     def decorator(func):
+        aux_pool = []
+
+        def get_executor():
+            if aux is None or mode == "thread":
+                return _get_pool(mode, max_workers, maxtasksperchild)
+            if not aux_pool:
+                aux_pool.append(_make_pool(
+                    mode, max_workers, maxtasksperchild,
+                    initializer=_set_aux, initargs=(aux,)))
+            return aux_pool[0]
+
         @functools.wraps(func)
         def wrapper(data_list, *args, **kwargs):
-            Executor = ThreadPoolExecutorPlus if mode == "thread" else ProcessPoolExecutorPlus
-            results = []
-            with Executor(max_workers=max_workers) as executor:
+            executor = get_executor()
+            if mode == "thread":
+                if aux is not None:
+                    args = (aux,) + args
                 futures = [executor.submit(
                     func, item, *args, **kwargs) for item in data_list]
-                if return_results:
-                    for f in futures:
-                        results.append(f.result())
+                wait(futures, return_when=ALL_COMPLETED)
+                results = [f.result() for f in futures]
+                return results if return_results else None
+
+            data_list = list(data_list)
+            workers = max_workers or executor._max_workers
+            chunksize = max(1, len(data_list) // (workers * 4))
+            runner = _apply if aux is None else _run_with_aux
+            results = list(executor.map(
+                functools.partial(runner, func, args, kwargs),
+                data_list, chunksize=chunksize))
             return results if return_results else None
         return wrapper
     return decorator
@@ -88,18 +183,63 @@ def log_calls(level=logging.INFO, stream=False):
     return decorator
 
 
-def use_queue(queue: SafeQueue):
+def use_queue(queue: SafeQueue, batch_size=1, flush_interval=None):
     """
     Automatically enqueue the function's result to a shared HyperProcess queue.
+
+    With ``batch_size > 1`` or a ``flush_interval``, results are buffered per
+    thread and enqueued as lists, so the consumer receives one list per
+    ``get()`` and pays the put cost once per batch. Partial batches are
+    flushed when ``flush_interval`` has elapsed (checked on each call), when
+    ``wrapper.flush()`` is called, and at interpreter exit.
     
     Args:
         queue (SafeQueue): Shared queue instance from core.shared.queues
+        batch_size (int): Number of results per put.
+        flush_interval (float): Max seconds a partial batch may wait.
     """
+    batching = batch_size > 1 or flush_interval is not None
+
     def decorator(func):
+        local = threading.local()
+        buffers = []
+        lock = threading.Lock()
+
+        def flush_buffer(buf):
+            items = []
+            while buf:
+                items.append(buf.popleft())
+            if items:
+                queue.put(items)
+
+        def flush():
+            with lock:
+                for buf in buffers:
+                    flush_buffer(buf)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
-            queue.put(result)
+            if not batching:
+                queue.put(result)
+                return result
+            buf = getattr(local, "buf", None)
+            if buf is None:
+                buf = local.buf = collections.deque()
+                local.last_flush = time.monotonic()
+                with lock:
+                    buffers.append(buf)
+            buf.append(result)
+            now = time.monotonic()
+            if len(buf) >= batch_size or (
+                    flush_interval is not None
+                    and now - local.last_flush >= flush_interval):
+                flush_buffer(buf)
+                local.last_flush = now
             return result
+
+        if batching:
+            atexit.register(flush)
+        wrapper.flush = flush
         return wrapper
     return decorator
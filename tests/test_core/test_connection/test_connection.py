@@ -0,0 +1,138 @@
+# tests/test_core/test_connection/test_connection.py
+
+import hmac
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import AuthenticationError, Pipe
+from multiprocessing.shared_memory import SharedMemory
+from unittest import mock
+from hyperprocess.core.connection import (
+    SHM_SLOT_SIZE,
+    SHM_THRESHOLD,
+    ChallengeSource,
+    SharedMemoryChannel,
+    _negotiate_shm,
+    _shm_handshake,
+    client_handshake,
+    server_handshake,
+)
+
+
+def _handshake(server_key, client_key, **server_kwargs):
+    """Run both sides over a Pipe; return (server outcome, client outcome, ends)."""
+    server_end, client_end = Pipe()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        server = executor.submit(server_handshake, server_end, server_key, **server_kwargs)
+        try:
+            client_handshake(client_end, client_key)
+            client_error = None
+        except AuthenticationError as exc:
+            client_error = exc
+        try:
+            server.result(timeout=10)
+            server_error = None
+        except AuthenticationError as exc:
+            server_error = exc
+    return server_error, client_error, (server_end, client_end)
+
+
+class TestHandshake(unittest.TestCase):
+    def test_matching_keys(self):
+        server_error, client_error, (server_end, client_end) = _handshake(b"secret", b"secret")
+        self.assertIsNone(server_error)
+        self.assertIsNone(client_error)
+        client_end.send_bytes(b"ping")
+        self.assertEqual(server_end.recv_bytes(), b"ping")
+
+    def test_matching_keys_with_template_and_challenges(self):
+        server_error, client_error, _ = _handshake(
+            b"secret", b"secret",
+            hmac_template=hmac.new(b"secret", b"", "sha256"),
+            challenges=ChallengeSource())
+        self.assertIsNone(server_error)
+        self.assertIsNone(client_error)
+
+    def test_wrong_client_key(self):
+        server_error, client_error, _ = _handshake(b"secret", b"wrong")
+        self.assertIsInstance(server_error, AuthenticationError)
+        self.assertIsInstance(client_error, AuthenticationError)
+
+
+def _channels():
+    """Return a (server, client) pair of SharedMemoryChannel over a Pipe."""
+    server_end, client_end = Pipe()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        server = executor.submit(_shm_handshake, server_end, True)
+        client = _shm_handshake(client_end, False)
+        return server.result(timeout=10), client
+
+
+class TestSharedMemoryChannel(unittest.TestCase):
+    def setUp(self):
+        self.server, self.client = _channels()
+
+    def tearDown(self):
+        self.server.close()
+        self.client.close()
+
+    def _roundtrip(self, payload):
+        self.client.send_large(payload)
+        view = self.server.recv_large()
+        self.assertEqual(bytes(view), payload)
+
+    def test_small_payload_inline(self):
+        self._roundtrip(b"x" * (SHM_THRESHOLD - 1))
+
+    def test_large_payload_through_ring(self):
+        for i in range(20):
+            self._roundtrip(bytes([i]) * SHM_THRESHOLD * 2)
+
+    def test_oversized_payload_falls_back(self):
+        self._roundtrip(b"y" * (SHM_SLOT_SIZE + 1))
+
+    def test_delegates_to_connection(self):
+        self.client.send_bytes(b"plain")
+        self.assertEqual(self.server.recv_bytes(), b"plain")
+
+    def test_close_unlinks_owned_ring(self):
+        server, client = _channels()
+        names = [server.name, client.name]
+        server.close()
+        client.close()
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                SharedMemory(name=name)
+
+
+class TestNegotiateShm(unittest.TestCase):
+    def _negotiate(self, server_env, client_env):
+        server_end, client_end = Pipe()
+
+        def server():
+            with mock.patch.dict(os.environ, {"HYPERPROCESS_SHM": server_env}):
+                return _negotiate_shm(server_end, server=True)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(server)
+            with mock.patch.dict(os.environ, {"HYPERPROCESS_SHM": client_env}):
+                client = _negotiate_shm(client_end, server=False)
+            server = pending.result(timeout=10)
+        self.addCleanup(server.close)
+        self.addCleanup(client.close)
+        return server, client
+
+    def test_both_offer(self):
+        server, client = self._negotiate("1", "1")
+        self.assertIsInstance(server, SharedMemoryChannel)
+        self.assertIsInstance(client, SharedMemoryChannel)
+
+    def test_one_side_declines(self):
+        for server_env, client_env in (("1", "0"), ("0", "1"), ("0", "0")):
+            server, client = self._negotiate(server_env, client_env)
+            self.assertNotIsInstance(server, SharedMemoryChannel)
+            self.assertNotIsInstance(client, SharedMemoryChannel)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+# tests/test_core/test_parallel/test_process_pool.py
+
+import functools
+import os
+import unittest
+import time
+from concurrent.futures import CancelledError
+from hyperprocess.core.parallel.process_pool import Pool, get_pool
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _div(a, b):
+    return a // b
+
+
+def _noop(*args):
+    pass
+
+
+def _row_sum(array, row):
+    return float(array[row].sum())
+
+
+def _reject(array):
+    raise ValueError(array.shape)
+
+
+def _build_state():
+    return {"pid": os.getpid(), "token": os.urandom(8)}
+
+
+def _read_state(state):
+    return os.getpid(), state["pid"], state["token"]
+
+
+def _shm_names():
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+class TestSubmitMany(unittest.TestCase):
+    def test_results_in_input_order(self):
+        with Pool(2) as pool:
+            futures = pool.submit_many(_div, [(i * 6, 3) for i in range(10)], chunksize=3)
+            self.assertEqual([f.result(timeout=30) for f in futures], [i * 2 for i in range(10)])
+
+    def test_per_call_exceptions(self):
+        with Pool(2) as pool:
+            futures = pool.submit_many(_div, [(6, 3), (1, 0), (9, 3)], chunksize=3)
+            self.assertEqual(futures[0].result(timeout=30), 2)
+            with self.assertRaises(ZeroDivisionError):
+                futures[1].result(timeout=30)
+            self.assertEqual(futures[2].result(timeout=30), 3)
+
+    def test_cancelled_chunks_fail_their_calls(self):
+        pool = Pool(1)
+        pool.submit(_sleep, 0.5)
+        futures = pool.submit_many(_sleep, [(0,)] * 8, chunksize=1)
+        pool.shutdown(wait=True, cancel_futures=True)
+        cancelled = 0
+        for future in futures:
+            self.assertTrue(future.done())
+            try:
+                future.result(timeout=0)
+            except CancelledError:
+                cancelled += 1
+        self.assertGreater(cancelled, 0)
+
+
+class TestGetPool(unittest.TestCase):
+    def test_reused_across_with_blocks(self):
+        with get_pool(2, initializer=_noop, initargs=(1,)) as pool:
+            self.assertEqual(pool.map_list(abs, [-1, -2]), [1, 2])
+        self.addCleanup(pool.shutdown)
+        # Leaving the with-block must not shut the shared pool down
+        with get_pool(2, initializer=_noop, initargs=(1,)) as again:
+            self.assertIs(again, pool)
+            self.assertEqual(again.map_list(abs, [-3]), [3])
+
+    def test_mismatched_arguments(self):
+        pool = get_pool(2, initializer=_noop, initargs=(1,), max_tasks_per_child=10)
+        self.addCleanup(pool.shutdown)
+        with self.assertRaises(ValueError):
+            get_pool(2, initializer=_noop, initargs=(2,), max_tasks_per_child=10)
+        with self.assertRaises(ValueError):
+            get_pool(2, initializer=_noop, initargs=(1,), max_tasks_per_child=20)
+        self.assertIs(get_pool(2, initializer=_noop, initargs=(1,), max_tasks_per_child=10), pool)
+
+    def test_replaced_after_shutdown(self):
+        pool = get_pool(3)
+        pool.shutdown()
+        fresh = get_pool(3)
+        self.addCleanup(fresh.shutdown)
+        self.assertIsNot(fresh, pool)
+        self.assertEqual(fresh.map_list(abs, [-4]), [4])
+
+
+class TestWarm(unittest.TestCase):
+    def test_state_built_once_per_worker(self):
+        with Pool(2) as pool:
+            pool.warm(_build_state)
+            futures = [pool.apply_async(_read_state, shared=("state",)) for _ in range(40)]
+            seen = {}
+            for future in futures:
+                pid, built_in, token = future.result(timeout=30)
+                self.assertEqual(pid, built_in)
+                self.assertEqual(seen.setdefault(pid, token), token)
+
+    def test_after_start(self):
+        with Pool(1) as pool:
+            pool.submit(abs, -1).result(timeout=30)
+            with self.assertRaises(RuntimeError):
+                pool.warm(_build_state)
+
+
+class TestManagerResultQueue(unittest.TestCase):
+    def setUp(self):
+        self.pool = Pool(2, result_queue="manager")
+        self.addCleanup(self.pool.shutdown)
+
+    def test_map_keeps_order(self):
+        results = self.pool.map_list(_div, range(0, 300, 3), [3] * 100, chunksize=7)
+        self.assertEqual(results, list(range(100)))
+
+    def test_imap_unordered(self):
+        results = self.pool.imap_unordered(abs, range(-50, 0), chunksize=4)
+        self.assertEqual(sorted(results), list(range(1, 51)))
+
+    def test_errors_propagate(self):
+        with self.assertRaises(ZeroDivisionError):
+            self.pool.map_list(_div, [1, 2, 3], [1, 0, 1])
+        with self.assertRaises(ZeroDivisionError):
+            list(self.pool.imap_unordered(functools.partial(_div, 1), [1, 0, 1]))
+        # The pool stays usable after a failed map
+        self.assertEqual(self.pool.map_list(abs, [-1, -2]), [1, 2])
+
+
+@unittest.skipUnless(np is not None, "requires numpy")
+class TestMapShared(unittest.TestCase):
+    def test_results(self):
+        array = np.arange(100_000, dtype=np.float64).reshape(100, 1000)
+        with Pool(2) as pool:
+            results = pool.map_shared(_row_sum, [(array, row) for row in range(100)])
+        self.assertEqual(results, [float(array[row].sum()) for row in range(100)])
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "needs /dev/shm")
+    def test_blocks_unlinked(self):
+        array = np.ones((200, 200))
+        before = _shm_names()
+        with Pool(2) as pool:
+            pool.map_shared(_row_sum, [(array, row) for row in range(10)])
+            self.assertEqual(_shm_names(), before)
+            with self.assertRaises(ValueError):
+                pool.map_shared(_reject, [array, array])
+            self.assertEqual(_shm_names(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
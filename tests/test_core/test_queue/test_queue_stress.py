@@ -2,7 +2,7 @@
 
 import time
 from multiprocessing import Process
-from fastproc.fastqueue import Queue
+from hyperprocess.core.queue import Queue
 
 N = 100_000
 
@@ -2,10 +2,21 @@
 
 import unittest
 import time
-from fastproc.fastqueue import Queue, JoinableQueue
+from multiprocessing import get_context
+from hyperprocess.core.queue import Queue, JoinableQueue
 from queue import Empty, Full
 
 
+def _produce(q, count):
+    for i in range(count):
+        q.put(i)
+
+
+def _consume(q, results, count):
+    for _ in range(count):
+        results.put(q.get(timeout=10))
+
+
 class TestQueueUnit(unittest.TestCase):
     def test_put_and_get(self):
         q = Queue(maxsize=2)
@@ -26,12 +37,84 @@ class TestQueueUnit(unittest.TestCase):
         with self.assertRaises(Empty):
             q.get(timeout=0.1)
 
+    def test_put_many(self):
+        q = Queue(maxsize=3)
+        q.put_many([1, 2])
+        self.assertEqual(q.qsize(), 2)
+        with self.assertRaises(Full):
+            q.put_many([3, 4], block=False)
+        self.assertEqual([q.get(), q.get(), q.get()], [1, 2, 3])
+
     def test_joinable_queue(self):
         q = JoinableQueue(maxsize=2)
         q.put("task1")
         self.assertEqual(q.get(), "task1")
         q.task_done()
 
+    def test_cross_process(self):
+        ctx = get_context("spawn")
+        q = Queue(maxsize=8, ctx=ctx)
+        results = Queue(ctx=ctx)
+        producer = ctx.Process(target=_produce, args=(q, 50))
+        consumer = ctx.Process(target=_consume, args=(q, results, 50))
+        producer.start()
+        consumer.start()
+        producer.join(30)
+        consumer.join(30)
+        self.assertEqual(producer.exitcode, 0)
+        self.assertEqual(consumer.exitcode, 0)
+        self.assertEqual([results.get(timeout=1) for _ in range(50)], list(range(50)))
+
+    def test_full_ring(self):
+        q = Queue(maxsize=10, ring_bytes=4096)
+        q.put(b"x" * 3000)
+        with self.assertRaises(Full):
+            q.put(b"y" * 3000, block=False)
+        with self.assertRaises(Full):
+            q.put(b"y" * 3000, timeout=0)
+        start = time.monotonic()
+        with self.assertRaises(Full):
+            q.put(b"y" * 3000, timeout=0.2)
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+        self.assertEqual(q.get(), b"x" * 3000)
+        q.put(b"y" * 3000, block=False)
+        self.assertEqual(q.get(), b"y" * 3000)
+
+    def test_unbounded_spills_instead_of_waiting(self):
+        q = Queue(ring_bytes=4096)
+        for i in range(4):
+            q.put_nowait(bytes([i]) * 3000)
+        self.assertFalse(q.full())
+        self.assertEqual([q.get() for _ in range(4)], [bytes([i]) * 3000 for i in range(4)])
+
+    def test_joinable_put_many(self):
+        q = JoinableQueue()
+        q.put_many(["a", "b", "c"])
+        for _ in range(3):
+            q.get()
+            q.task_done()
+        q.join()
+        with self.assertRaises(ValueError):
+            q.task_done()
+
+    def test_joinable_put_many_full(self):
+        q = JoinableQueue(maxsize=2)
+        with self.assertRaises(Full):
+            q.put_many([1, 2, 3], block=False)
+        self.assertEqual([q.get(), q.get()], [1, 2])
+        q.task_done()
+        q.task_done()
+        q.join()
+
+    def test_oversized_item(self):
+        q = Queue(ring_bytes=64 * 1024)
+        payload = bytes(range(256)) * 1024
+        q.put(payload)
+        q.put_many([payload, "small"])
+        self.assertEqual(q.get(), payload)
+        self.assertEqual(q.get(), payload)
+        self.assertEqual(q.get(), "small")
+
 
 if __name__ == "__main__":
     unittest.main()
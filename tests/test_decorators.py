@@ -43,6 +43,27 @@ def test_parallelize_plus_process():
     assert cube(data) == [1, 8, 27]
 
 
+def test_parallelize_plus_reuses_pool():
+    from hyperprocess.decorators import _get_pool
+
+    @parallelize_plus(mode="thread", max_workers=3)
+    def double(x):
+        return x * 2
+
+    assert double([1, 2]) == [2, 4]
+    pool = _get_pool("thread", 3, None)
+    assert double([3]) == [6]
+    assert _get_pool("thread", 3, None) is pool
+
+
+def test_parallelize_plus_aux():
+    @parallelize_plus(mode="thread", max_workers=2, aux={"offset": 10})
+    def shift(x, aux):
+        return x + aux["offset"]
+
+    assert shift([1, 2, 3]) == [11, 12, 13]
+
+
 def test_log_calls(caplog):
     @log_calls()
     def echo(x):
@@ -64,3 +85,17 @@ def test_use_queue():
     result = produce(9)
     assert result == 10
     assert queue.get(timeout=1) == 10
+
+
+def test_use_queue_batches():
+    queue = SafeQueue()
+
+    @use_queue(queue, batch_size=2)
+    def produce(x):
+        return x
+
+    for i in range(3):
+        produce(i)
+    assert queue.get(timeout=1) == [0, 1]
+    produce.flush()
+    assert queue.get(timeout=1) == [2]